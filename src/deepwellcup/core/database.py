@@ -1,18 +1,276 @@
 """Class for interacting with the database"""
+# pylint: disable=C0302
+import contextlib
+import itertools
 import sqlite3
+import threading
 import typing
+import urllib.parse
+import uuid
 import warnings
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 import numpy as np
 import pandas as pd
 
+from deepwellcup.points.points_systems import fixed_pick_points
 from deepwellcup.utils import dirs, io, utils
 from deepwellcup.utils.nhl_teams import create_series_name
-from deepwellcup.utils.utils import PlayedRound, RoundInfo
+from deepwellcup.utils.utils import PlayedRound, RoundInfo, SelectionRound
 
 Monikers = dict[str, str]
 
+POINTS_COLUMNS = ["Year", "Round", "Individual", "Component", "Points"]
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_BUSY_TIMEOUT = 5.0
+DEFAULT_SYNCHRONOUS = "NORMAL"
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+STATEMENTS: dict[str, str] = {
+    "individuals": (
+        "SELECT IndividualID, FirstName, LastName FROM Individuals "
+        "WHERE IndividualID > ?"
+    ),
+    "add_individuals": "INSERT INTO Individuals(FirstName, LastName) VALUES (?,?)",
+    "monikers": (
+        "SELECT IndividualID, Moniker FROM Monikers WHERE Year = ? AND Round = ?"
+    ),
+    "add_monikers": "INSERT INTO Monikers VALUES (?,?,?,?)",
+    "preferences": (
+        "SELECT IndividualID, FavouriteTeam, CheeringTeam "
+        "FROM Preferences WHERE Year = ? AND Round = ?"
+    ),
+    "add_preferences": "INSERT INTO Preferences VALUES (?,?,?,?,?)",
+    "series": (
+        "SELECT Conference, SeriesNumber, "
+        "TeamHigherSeed, TeamLowerSeed, PlayerHigherSeed, PlayerLowerSeed "
+        "FROM Series WHERE Year = ? AND Round = ?"
+    ),
+    "series_ids": (
+        "SELECT YearRoundSeriesID, Conference, TeamHigherSeed, TeamLowerSeed "
+        "FROM Series WHERE Year = ? AND Round = ?"
+    ),
+    "series_with_number": (
+        "SELECT SeriesNumber, Conference, TeamHigherSeed, TeamLowerSeed "
+        "FROM Series WHERE Year = ? AND Round = ?"
+    ),
+    "add_series": (
+        "INSERT INTO Series("
+        "Year, Round, Conference, SeriesNumber, "
+        "TeamHigherSeed, TeamLowerSeed, PlayerHigherSeed, PlayerLowerSeed) "
+        "VALUES (?,?,?,?,?,?,?,?)"
+    ),
+    "round_selections": """
+        SELECT Ser.Conference, Ser.SeriesNumber,
+            Ser.TeamHigherSeed, Ser.TeamLowerSeed,
+            Ind.FirstName, Ind.LastName,
+            SS.Team, SS.Duration, SS.Player
+        FROM Individuals as Ind
+        LEFT JOIN (SeriesSelections as SS
+            Inner JOIN Series as Ser
+            ON Ser.YearRoundSeriesID = SS.YearRoundSeriesID)
+        ON Ind.IndividualID = SS.IndividualID
+        WHERE Ser.Year = ?
+        AND Ser.Round = ?
+        ORDER BY FirstName, LastName, Conference, SeriesNumber
+        """,
+    "add_round_selections": "INSERT INTO SeriesSelections VALUES (?,?,?,?,?)",
+    "series_selections": """
+        SELECT Ser.Conference, Ser.SeriesNumber,
+            Ser.TeamHigherSeed, Ser.TeamLowerSeed,
+            Ind.FirstName, Ind.LastName,
+            SS.Team, SS.Duration, SS.Player
+        FROM SeriesSelections as SS
+        INNER JOIN Series as Ser
+            ON Ser.YearRoundSeriesID = SS.YearRoundSeriesID
+        INNER JOIN Individuals as Ind
+            ON Ind.IndividualID = SS.IndividualID
+        WHERE SS.YearRoundSeriesID = ?
+        ORDER BY FirstName, LastName
+        """,
+    "round_results": """
+        SELECT Ser.Conference, Ser.SeriesNumber,
+            Ser.TeamHigherSeed, Ser.TeamLowerSeed,
+            SR.Team, SR.Duration, SR.Player
+        FROM (SeriesResults as SR
+            Inner JOIN Series as Ser
+            ON Ser.YearRoundSeriesID = SR.YearRoundSeriesID)
+        WHERE Ser.Year = ?
+        AND Ser.Round = ?
+        ORDER BY Conference, SeriesNumber
+        """,
+    "add_round_results": "INSERT INTO SeriesResults VALUES (?,?,?,?)",
+    "champions_selections": (
+        "SELECT IndividualID, East, West, [Stanley Cup], Duration "
+        "FROM StanleyCupSelections WHERE Year = ?"
+    ),
+    "add_champions_selections": (
+        "INSERT INTO StanleyCupSelections VALUES (?,?,?,?,?,?)"
+    ),
+    "champions_results": (
+        "SELECT East, West, [Stanley Cup], Duration "
+        "FROM StanleyCupResults WHERE Year = ?"
+    ),
+    "add_finalists_results": (
+        "INSERT INTO StanleyCupResults (Year, East, West) VALUES (?,?,?)"
+    ),
+    "add_stanley_cup_champion_results": (
+        "UPDATE StanleyCupResults SET [Stanley Cup] = ?, Duration = ? WHERE Year = ?"
+    ),
+    "overtime_selections": """
+        SELECT Ind.FirstName, Ind.LastName, OT.Overtime
+        FROM (Individuals as Ind
+            Inner JOIN OvertimeSelections as OT
+            ON OT.IndividualID = Ind.IndividualID)
+        WHERE OT.Year = ?
+        AND OT.Round = ?
+        """,
+    "add_overtime_selections": "INSERT INTO OvertimeSelections VALUES (?,?,?,?)",
+    "overtime_results": (
+        "SELECT Overtime FROM OvertimeResults WHERE Year = ? AND Round = ?"
+    ),
+    "add_overtime_results": "INSERT INTO OvertimeResults VALUES (?,?,?)",
+    "other_points": """
+        SELECT Ind.FirstName, Ind.LastName, OP.Points
+        FROM (Individuals as Ind
+            Inner JOIN OtherPoints as OP
+            ON OP.IndividualID = Ind.IndividualID)
+        WHERE OP.Year = ?
+        AND OP.Round = ?
+        """,
+    "add_other_points": "INSERT INTO OtherPoints VALUES (?,?,?,?)",
+    "round_points": """
+        SELECT Ind.FirstName, Ind.LastName,
+            SUM(CASE WHEN SS.Team = SR.Team THEN ? ELSE 0 END)
+            + SUM(CASE WHEN SS.Duration = SR.Duration THEN ? ELSE 0 END)
+            + SUM(CASE WHEN SS.Duration = SR.Duration AND SR.Duration = 7
+                THEN ? ELSE 0 END)
+        FROM SeriesSelections as SS
+        INNER JOIN Series as Ser
+            ON Ser.YearRoundSeriesID = SS.YearRoundSeriesID
+        INNER JOIN Individuals as Ind
+            ON Ind.IndividualID = SS.IndividualID
+        LEFT JOIN SeriesResults as SR
+            ON SR.YearRoundSeriesID = SS.YearRoundSeriesID
+        WHERE Ser.Year = ? AND Ser.Round = ?
+        GROUP BY SS.IndividualID
+        ORDER BY Ind.FirstName, Ind.LastName
+        """,
+    "running_totals": """
+        SELECT Ind.FirstName, Ind.LastName, P.Points
+        FROM Points as P
+        INNER JOIN Individuals as Ind
+            ON Ind.IndividualID = P.IndividualID
+        WHERE P.Year = ? AND P.Round = ? AND P.Component = 'Selection'
+        """,
+    "add_selection_points": """
+        INSERT INTO Points VALUES (?,?,?,'Selection',?)
+        ON CONFLICT (Year, Round, IndividualID, Component)
+        DO UPDATE SET Points = Points + excluded.Points
+        """,
+    "points": """
+        SELECT P.Year, P.Round, Ind.FirstName, Ind.LastName, P.Component, P.Points
+        FROM Points as P
+        INNER JOIN Individuals as Ind
+            ON Ind.IndividualID = P.IndividualID
+        WHERE P.Year BETWEEN ? AND ?
+        ORDER BY P.Year, P.Round, P.Component, Ind.FirstName, Ind.LastName
+        """,
+    "standings": """
+        SELECT Ind.FirstName, Ind.LastName, SUM(P.Points)
+        FROM Points as P
+        INNER JOIN Individuals as Ind
+            ON Ind.IndividualID = P.IndividualID
+        WHERE P.Year = ?
+        GROUP BY P.IndividualID
+        """,
+    "add_points": "INSERT INTO Points VALUES (?,?,?,?,?)",
+    "delete_points": "DELETE FROM Points WHERE Year = ? AND Round = ?",
+    "season_monikers": (
+        "SELECT Year, Round, IndividualID, Moniker FROM Monikers "
+        "WHERE Year BETWEEN ? AND ? ORDER BY Year, Round, IndividualID"
+    ),
+    "season_preferences": (
+        "SELECT Year, Round, IndividualID, FavouriteTeam, CheeringTeam "
+        "FROM Preferences WHERE Year BETWEEN ? AND ? "
+        "ORDER BY Year, Round, IndividualID"
+    ),
+    "season_series": (
+        "SELECT Year, Round, Conference, SeriesNumber, "
+        "TeamHigherSeed, TeamLowerSeed, PlayerHigherSeed, PlayerLowerSeed "
+        "FROM Series WHERE Year BETWEEN ? AND ? "
+        "ORDER BY Year, Round, Conference, SeriesNumber"
+    ),
+    "season_selections": """
+        SELECT Ser.Year, Ser.Round, Ser.Conference, Ser.SeriesNumber,
+            Ser.TeamHigherSeed, Ser.TeamLowerSeed,
+            Ind.FirstName, Ind.LastName,
+            SS.Team, SS.Duration, SS.Player
+        FROM Individuals as Ind
+        LEFT JOIN (SeriesSelections as SS
+            Inner JOIN Series as Ser
+            ON Ser.YearRoundSeriesID = SS.YearRoundSeriesID)
+        ON Ind.IndividualID = SS.IndividualID
+        WHERE Ser.Year BETWEEN ? AND ?
+        ORDER BY Year, Round, FirstName, LastName, Conference, SeriesNumber
+        """,
+    "season_results": """
+        SELECT Ser.Year, Ser.Round, Ser.Conference, Ser.SeriesNumber,
+            Ser.TeamHigherSeed, Ser.TeamLowerSeed,
+            SR.Team, SR.Duration, SR.Player
+        FROM (SeriesResults as SR
+            Inner JOIN Series as Ser
+            ON Ser.YearRoundSeriesID = SR.YearRoundSeriesID)
+        WHERE Ser.Year BETWEEN ? AND ?
+        ORDER BY Year, Round, Conference, SeriesNumber
+        """,
+    "season_overtime_selections": """
+        SELECT OT.Year, OT.Round, Ind.FirstName, Ind.LastName, OT.Overtime
+        FROM (Individuals as Ind
+            Inner JOIN OvertimeSelections as OT
+            ON OT.IndividualID = Ind.IndividualID)
+        WHERE OT.Year BETWEEN ? AND ?
+        """,
+    "season_overtime_results": (
+        "SELECT Year, Round, Overtime FROM OvertimeResults "
+        "WHERE Year BETWEEN ? AND ?"
+    ),
+    "season_other_points": """
+        SELECT OP.Year, OP.Round, Ind.FirstName, Ind.LastName, OP.Points
+        FROM (Individuals as Ind
+            Inner JOIN OtherPoints as OP
+            ON OP.IndividualID = Ind.IndividualID)
+        WHERE OP.Year BETWEEN ? AND ?
+        """,
+    "season_champions_selections": (
+        "SELECT Year, IndividualID, East, West, [Stanley Cup], Duration "
+        "FROM StanleyCupSelections WHERE Year BETWEEN ? AND ? ORDER BY Year, rowid"
+    ),
+    "season_champions_results": (
+        "SELECT Year, East, West, [Stanley Cup], Duration "
+        "FROM StanleyCupResults WHERE Year BETWEEN ? AND ?"
+    ),
+}
+
+
+class StatementCounts(typing.NamedTuple):
+    """Registered statements run again or for the first time on a connection."""
+
+    repeated: int
+    first: int
+
+
+class PooledConnection(sqlite3.Connection):  # pylint: disable=R0903
+    """Connection that records the registered statements it has run."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.statements_run: set[str] = set()
+
 
 class DuplicateEntryError(Exception):
     """Exception for duplicate database data."""
@@ -42,21 +300,159 @@ class ConferenceError(Exception):
     """Exception for incorrect conference."""
 
 
-class DataBase:  # pylint: disable=R0904
-    """DataBase handling."""
+class ReadOnlyError(Exception):
+    """Exception for writing to a read-only database."""
+
+
+class ConnectionPool:
+    """Pool of long-lived database connections.
+
+    Connections are opened on demand and, once released, kept open for reuse
+    until the pool holds `size` idle connections.
+    """
+
+    def __init__(self, connect: typing.Callable[[], sqlite3.Connection], size: int):
+        if size < 1:
+            raise ValueError(f"The pool size must be at least 1, received {size}")
+        self._connect = connect
+        self._size = size
+        self._idle: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    @property
+    def size(self) -> int:
+        """Return the maximum number of idle connections kept open."""
+        return self._size
+
+    @property
+    def opened(self) -> int:
+        """Return the number of connections opened by the pool."""
+        return self._opened
+
+    def acquire(self) -> sqlite3.Connection:
+        """Return an idle connection, opening a new one if none are available."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            self._opened += 1
+        return self._connect()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool."""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class DataBase:  # pylint: disable=R0902,R0904
+    """DataBase handling.
+
+    Connections are drawn from a pool and kept open between uses, so nested and
+    repeated `with` blocks share a warm connection. Call `close` once the
+    database is no longer needed.
 
-    def __init__(self, database_file: Path | None = None):
-        self._conn: sqlite3.Connection | None = None
-        self._cursor: sqlite3.Cursor | None = None
+    The database is kept in WAL journal mode so that readers, such as a
+    ReadOnlyDataBase, are not blocked while it is written to.
+    """
+
+    read_only = False
+
+    def __init__(  # pylint: disable=R0913
+        self,
+        database_file: Path | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        synchronous: str = DEFAULT_SYNCHRONOUS,
+        in_memory: bool = False,
+    ):
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(
+                f"The synchronous level must be one of {SYNCHRONOUS_LEVELS}, "
+                f"received {synchronous}"
+            )
+        self._busy_timeout = busy_timeout
+        self._synchronous = synchronous.upper()
+        self._local = threading.local()
+        self._ids_of_individuals: dict[str, int] | None = None
+        self._individuals_of_ids: dict[int, str] | None = None
+        self._statements_repeated = 0
+        self._statements_first = 0
         self._path = self._database_path(database_file)
+        self._in_memory = in_memory
+        self._memory_anchor: sqlite3.Connection | None = None
+        self._memory_name = uuid.uuid4().hex
+        self._pool = ConnectionPool(self.connect, pool_size)
+        self._initialize()
+
+    def _initialize(self) -> None:
+        """Create or migrate the database file."""
+        if self._in_memory:
+            self._memory_anchor = self.connect()
         if not self._path.exists():
             self.create_database()
+            return
+        if self._memory_anchor is not None:
+            self._load_file_into_memory(self._memory_anchor)
+        self.migrate()
+
+    def _load_file_into_memory(self, memory: sqlite3.Connection) -> None:
+        """Copy the database file into the in-memory database."""
+        source = sqlite3.connect(f"{_file_uri(self._path)}?mode=ro", uri=True)
+        source.backup(memory)
+        source.close()
+
+    @property
+    def in_memory(self) -> bool:
+        """Return whether the database is held in memory until saved."""
+        return self._in_memory
 
     @property
     def path(self) -> Path:
         """Return the database path."""
         return self._path
 
+    @property
+    def connections_opened(self) -> int:
+        """Return the number of connections opened by the pool."""
+        return self._pool.opened
+
+    @property
+    def _conn(self) -> sqlite3.Connection | None:
+        """Return the connection in use by this thread."""
+        return getattr(self._local, "conn", None)
+
+    @property
+    def _cursor(self) -> sqlite3.Cursor | None:
+        """Return the cursor in use by this thread."""
+        return getattr(self._local, "cursor", None)
+
+    @property
+    def _depth(self) -> int:
+        """Return the number of open `with` blocks in this thread."""
+        return getattr(self._local, "depth", 0)
+
+    @property
+    def _transaction_depth(self) -> int:
+        """Return the number of open transactions in this thread."""
+        return getattr(self._local, "transaction_depth", 0)
+
+    @property
+    def in_transaction(self) -> bool:
+        """Return whether this thread has an open transaction."""
+        return self._transaction_depth > 0
+
     def _database_path(self, database_file: Path | None) -> Path:
         """Return the path to the database."""
         if database_file is None:
@@ -66,18 +462,98 @@ class DataBase:  # pylint: disable=R0904
         return dirs.products() / database_file
 
     def __enter__(self):
-        self._conn = self.connect()
-        self._cursor = self._conn.cursor()
+        if self._depth == 0:
+            conn = self._pool.acquire()
+            self._local.conn = conn
+            self._local.cursor = conn.cursor()
+        self._local.depth = self._depth + 1
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
-        self._conn.close()
-        self._conn = None
-        self._cursor = None
+        self._local.depth = self._depth - 1
+        if self._depth == 0:
+            conn = self._conn
+            self._local.cursor.close()
+            self._local.conn = None
+            self._local.cursor = None
+            self._pool.release(conn)
+
+    @property
+    def busy_timeout(self) -> float:
+        """Return the seconds to wait for a locked database."""
+        return self._busy_timeout
+
+    @property
+    def synchronous(self) -> str:
+        """Return the synchronous level of the connections."""
+        return self._synchronous
+
+    @property
+    def journal_mode(self) -> str:
+        """Return the journal mode of the database file."""
+        conn = self.connect()
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        return str(mode)
+
+    def _uri(self) -> str:
+        """Return the URI to open the database with."""
+        if self._in_memory:
+            return f"file:deepwellcup-{self._memory_name}?mode=memory&cache=shared"
+        mode = "ro" if self.read_only else "rwc"
+        return f"{_file_uri(self.path)}?mode={mode}"
 
     def connect(self) -> sqlite3.Connection:
         """Connect to database."""
-        return sqlite3.connect(self.path, uri=True)
+        conn = sqlite3.connect(
+            self._uri(),
+            uri=True,
+            timeout=self._busy_timeout,
+            check_same_thread=False,
+            factory=PooledConnection,
+            cached_statements=max(len(STATEMENTS), 128),
+        )
+        conn.execute(f"PRAGMA synchronous = {self._synchronous}")
+        return conn
+
+    def close(self) -> None:
+        """Close the idle connections in the pool.
+
+        An in-memory database is discarded, so call `save` first to keep it.
+        """
+        self._pool.close()
+        if self._memory_anchor is not None:
+            self._memory_anchor.close()
+            self._memory_anchor = None
+
+    def save(self) -> None:
+        """Write an in-memory database to its file.
+
+        The database is copied into the file with the online backup API in a
+        single transaction, so readers of the file see either the old or the
+        new database.
+        """
+        if self._memory_anchor is None:
+            raise ValueError("Only an open in-memory database can be saved.")
+        target = sqlite3.connect(self.path, timeout=self._busy_timeout)
+        self._memory_anchor.backup(target)
+        target.execute("PRAGMA journal_mode = WAL")
+        target.close()
+
+    def read_season(self, year: int) -> "SeasonData":
+        """Return a season snapshot read in a single read transaction.
+
+        A read transaction does not block writers to a database in WAL mode.
+        """
+        with self:
+            conn = self._conn
+            if conn is None or self.in_transaction:
+                return self.load_season(year)
+            conn.execute("BEGIN")
+            try:
+                return self.load_season(year)
+            finally:
+                conn.commit()
 
     def create_database(self) -> None:
         """Create database."""
@@ -87,62 +563,185 @@ class DataBase:  # pylint: disable=R0904
         for file in files:
             self.create_table(cursor, file)
         conn.close()
+        self.migrate()
+
+    @property
+    def schema_version(self) -> int:
+        """Return the version of the most recent migration applied."""
+        conn = self.connect()
+        version = _schema_version(conn)
+        conn.close()
+        return version
+
+    def migrate(self) -> None:
+        """Apply the migrations newer than the database schema version.
+
+        Each migration and its version number are applied in one transaction.
+        """
+        conn = self.connect()
+        conn.execute("PRAGMA journal_mode = WAL")
+        version = _schema_version(conn)
+        for migration_version, file in migration_files(dirs.migrations()):
+            if migration_version <= version:
+                continue
+            conn.executescript(
+                "BEGIN;\n"
+                f"{file.read_text(encoding='utf-8')}\n"
+                f"PRAGMA user_version = {migration_version};\n"
+                "COMMIT;"
+            )
+        conn.close()
 
     def create_table(self, cursor: sqlite3.Cursor, table_file: Path) -> None:
         """Add a table."""
         command = io.read_file_to_string(table_file)
         cursor.execute(command)
 
-    def fetch(self, command: str) -> list[tuple[str, ...]]:
-        """Fetch data."""
+    @contextlib.contextmanager
+    def transaction(self) -> typing.Iterator["DataBase"]:
+        """Write everything in the block with a single commit.
+
+        Nested transactions join the outermost one. If the block raises, every
+        write since the outermost transaction began is rolled back.
+        """
+        if self.read_only:
+            raise ReadOnlyError(f"Cannot write to the read-only database {self.path}")
+        with self:
+            conn = self._conn
+            if conn is None:
+                raise sqlite3.ProgrammingError("The database has not been opened.")
+            if self._transaction_depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+            self._local.transaction_depth = self._transaction_depth + 1
+            try:
+                yield self
+            except BaseException:
+                self._local.transaction_depth = self._transaction_depth - 1
+                if self._transaction_depth == 0:
+                    conn.rollback()
+                    self._ids_of_individuals = None
+                    self._individuals_of_ids = None
+                raise
+            self._local.transaction_depth = self._transaction_depth - 1
+            if self._transaction_depth == 0:
+                conn.commit()
+
+    def statement_counts(self) -> StatementCounts:
+        """Return how many registered statements ran again or first on a connection.
+
+        These count statement names and do not inspect sqlite's statement cache.
+        """
+        return StatementCounts(self._statements_repeated, self._statements_first)
+
+    def _statement(self, name: str) -> str:
+        """Return a registered statement and count whether it was run before."""
+        conn = self._conn
+        if isinstance(conn, PooledConnection):
+            if name in conn.statements_run:
+                self._statements_repeated += 1
+            else:
+                conn.statements_run.add(name)
+                self._statements_first += 1
+        return STATEMENTS[name]
+
+    def fetch(self, statement: str, parameters: tuple = ()) -> list[tuple[str, ...]]:
+        """Fetch data with a registered statement."""
         if self._cursor:
-            return self._cursor.execute(command).fetchall()
+            return self._cursor.execute(
+                self._statement(statement), parameters
+            ).fetchall()
         warnings.warn("The database has not been opened. Nothing was fetched.")
         return []
 
-    def commit(self, command: str, data: typing.Sequence[tuple]) -> None:
-        """Commit data."""
+    def read_frame(self, statement: str, parameters: tuple = ()) -> pd.DataFrame:
+        """Read data into a DataFrame with a registered statement."""
+        return pd.read_sql_query(
+            self._statement(statement), self._conn, params=parameters
+        )
+
+    def commit(self, statement: str, data: typing.Iterable[tuple]) -> None:
+        """Commit data with a registered statement.
+
+        Inside a transaction the data is committed when the transaction ends.
+        """
+        if self.read_only:
+            raise ReadOnlyError(f"Cannot write to the read-only database {self.path}")
         if self._cursor and self._conn:
-            self._cursor.executemany(command, data)
-            self._conn.commit()
+            self._cursor.executemany(self._statement(statement), data)
+            if not self.in_transaction:
+                self._conn.commit()
 
     def get_individuals(self) -> list[str]:
         """Return individuals."""
-        return list(self.get_individuals_with_ids())
+        return list(self._individual_ids())
 
     def get_individuals_with_ids(self) -> dict[str, int]:
         """Return individuals with IDs."""
-        individuals_and_ids = self.fetch(
-            "SELECT IndividualID, FirstName, LastName FROM Individuals"
-        )
-        if individuals_and_ids:
-            return {
-                utils.merge_name(name): int(id) for id, *name in individuals_and_ids
-            }
-        return {}
+        return dict(self._individual_ids())
 
     def get_ids_with_individuals(self) -> dict[int, str]:
         """Return IDs with individuals."""
-        return {id: name for name, id in self.get_individuals_with_ids().items()}
+        return dict(self._id_individuals())
+
+    def _individual_ids(self, individuals: typing.Iterable[str] = ()) -> dict[str, int]:
+        """Return the identity map from individuals to IDs.
+
+        The map is refreshed when it is missing any of the individuals, as
+        another connection may have added them since it was loaded.
+        """
+        if self._ids_of_individuals is None:
+            self._load_individuals()
+        elif not set(individuals) <= self._ids_of_individuals.keys():
+            self._refresh_individuals()
+        return self._ids_of_individuals or {}
+
+    def _id_individuals(self, ids: typing.Iterable[int] = ()) -> dict[int, str]:
+        """Return the identity map from IDs to individuals.
+
+        The map is refreshed when it is missing any of the IDs, as another
+        connection may have added them since it was loaded.
+        """
+        if self._individuals_of_ids is None:
+            self._load_individuals()
+        elif not set(ids) <= self._individuals_of_ids.keys():
+            self._refresh_individuals()
+        return self._individuals_of_ids or {}
+
+    def _refresh_individuals(self) -> None:
+        """Load the individuals added since the identity map was loaded."""
+        self._load_individuals(after_id=max(self._individuals_of_ids or {}, default=0))
+
+    def _load_individuals(self, after_id: int = 0) -> None:
+        """Load individuals with an ID above after_id into the identity map."""
+        individuals_and_ids = self.fetch("individuals", (after_id,))
+        if not self._cursor:
+            return
+        ids_of_individuals = self._ids_of_individuals if after_id else None
+        individuals_of_ids = self._individuals_of_ids if after_id else None
+        if ids_of_individuals is None or individuals_of_ids is None:
+            ids_of_individuals, individuals_of_ids = {}, {}
+        for individual_id, *name in individuals_and_ids:
+            individual = utils.merge_name(name)
+            ids_of_individuals[individual] = int(individual_id)
+            individuals_of_ids[int(individual_id)] = individual
+        self._ids_of_individuals = ids_of_individuals
+        self._individuals_of_ids = individuals_of_ids
 
     def add_individuals(self, individuals: list[str]) -> None:
         """Add individuals."""
         for individual in individuals:
             _check_length_of_last_name(utils.last_name(individual))
-        existing_individuals = self.get_individuals()
-        if set(individuals).intersection(existing_individuals):
+        if set(individuals).intersection(self._individual_ids(individuals)):
             raise DuplicateEntryError("Individuals are already in the database.")
         new_individuals = [utils.split_name(individual) for individual in individuals]
-        self.commit(
-            "INSERT INTO Individuals(FirstName, LastName) VALUES (?,?)",
-            new_individuals,
-        )
+        self.commit("add_individuals", new_individuals)
+        self._refresh_individuals()
 
     def add_monikers(self, round_info: RoundInfo, monikers: Monikers) -> None:
         """Add monikers."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        individuals_with_ids = self.get_individuals_with_ids()
+        individuals_with_ids = self._individual_ids(monikers)
         missing_individuals = set(monikers) - set(individuals_with_ids)
         if missing_individuals:
             raise MissingIndividual(f"{missing_individuals} are not in the database.")
@@ -155,26 +754,14 @@ class DataBase:  # pylint: disable=R0904
             )
             for individual, moniker in monikers.items()
         ]
-        self.commit(
-            "INSERT INTO Monikers VALUES (?,?,?,?)",
-            series_data,
-        )
+        self.commit("add_monikers", series_data)
 
     def get_monikers(self, round_info: RoundInfo) -> Monikers:
         """Return the moniker for played round."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        monikers = self.fetch(
-            "SELECT IndividualID, Moniker "
-            f"FROM Monikers WHERE Year={round_info.year} "
-            f"AND Round='{round_info.played_round}'"
-        )
-        if monikers:
-            return {
-                self.get_ids_with_individuals()[int(id)]: moniker
-                for id, moniker in monikers
-            }
-        return {}
+        monikers = self.fetch("monikers", _round_parameters(round_info))
+        return _monikers_from_rows(monikers, self._id_individuals(_row_ids(monikers)))
 
     def add_preferences(
         self,
@@ -189,7 +776,7 @@ class DataBase:  # pylint: disable=R0904
             raise MismatchError(
                 "Favourite team index does not match cheering team index."
             )
-        individuals_with_ids = self.get_individuals_with_ids()
+        individuals_with_ids = self._individual_ids(favourite_team.index)
         series_data = [
             (
                 round_info.year,
@@ -200,32 +787,16 @@ class DataBase:  # pylint: disable=R0904
             )
             for individual in favourite_team.index
         ]
-        self.commit("INSERT INTO Preferences VALUES (?,?,?,?,?)", series_data)
+        self.commit("add_preferences", series_data)
 
     def get_preferences(self, round_info: RoundInfo) -> tuple[pd.Series, pd.Series]:
         """Return the preferences for played round."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        preferences = self.fetch(
-            "SELECT IndividualID, FavouriteTeam, CheeringTeam "
-            f"FROM Preferences WHERE Year={round_info.year} "
-            f"AND Round='{round_info.played_round}'"
-        )
-        if not preferences:
-            return _empty_series(), _empty_series()
-        favourite_team = pd.Series(
-            {
-                self.get_ids_with_individuals()[int(id)]: favourite_team
-                for id, favourite_team, _ in preferences
-            }
-        )
-        cheering_team = pd.Series(
-            {
-                self.get_ids_with_individuals()[int(id)]: cheering_team
-                for id, _, cheering_team in preferences
-            }
+        preferences = self.fetch("preferences", _round_parameters(round_info))
+        return _preferences_from_rows(
+            preferences, self._id_individuals(_row_ids(preferences))
         )
-        return favourite_team, cheering_team
 
     def add_series(
         self,
@@ -235,62 +806,27 @@ class DataBase:  # pylint: disable=R0904
         """Add series information."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        series_no_index = series.reset_index()
-        for conference in series_no_index["Conference"]:
+        series_no_index = series.reset_index().drop(columns="Name").astype(object)
+        for conference in series_no_index["Conference"].unique():
             check_conference(round_info.year, round_info.played_round, conference)
-        series_data = [
-            tuple([round_info.year, round_info.played_round])
-            + tuple(
-                map(
-                    lambda x: int(x) if isinstance(x, np.int64) else x,
-                    series_no_index.loc[index].drop("Name"),
-                )
-            )
-            for index in series_no_index.index
-        ]
-        self.commit(
-            "INSERT INTO Series("
-            "Year, Round, Conference, SeriesNumber, "
-            "TeamHigherSeed, TeamLowerSeed, PlayerHigherSeed, PlayerLowerSeed) "
-            "VALUES (?,?,?,?,?,?,?,?)",
-            series_data,
+        series_data = (
+            (round_info.year, round_info.played_round, *row)
+            for row in series_no_index.itertuples(index=False, name=None)
         )
+        self.commit("add_series", series_data)
 
     def get_series(self, round_info: RoundInfo) -> pd.DataFrame:
         """Return the series information for a played round."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        series = pd.read_sql_query(
-            "SELECT Conference, SeriesNumber, "
-            "TeamHigherSeed, TeamLowerSeed, PlayerHigherSeed, PlayerLowerSeed "
-            f"FROM Series WHERE Year={round_info.year} "
-            f"AND Round={round_info.played_round}",
-            self._conn,
-        ).rename(
-            columns={
-                "SeriesNumber": "Series Number",
-                "TeamHigherSeed": "Higher Seed",
-                "TeamLowerSeed": "Lower Seed",
-                "PlayerHigherSeed": "Player on Higher Seed",
-                "PlayerLowerSeed": "Player on Lower Seed",
-            }
-        )
-        series.insert(
-            2,
-            "Name",
-            list(map(create_series_name, series["Higher Seed"], series["Lower Seed"])),
-        )
-        return series.set_index(["Conference", "Series Number"])
+        series = self.read_frame("series", _round_parameters(round_info))
+        return _series_from_frame(series)
 
     def get_series_ids(self, round_info: RoundInfo) -> dict[tuple[str, str], int]:
         """Return the series information with IDs for a played round."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        series = self.fetch(
-            "SELECT YearRoundSeriesID, Conference, TeamHigherSeed, TeamLowerSeed "
-            f"FROM Series WHERE Year={round_info.year} "
-            f"AND Round='{round_info.played_round}'"
-        )
+        series = self.fetch("series_ids", _round_parameters(round_info))
         if not series:
             return {}
         return {
@@ -310,11 +846,7 @@ class DataBase:  # pylint: disable=R0904
         """Return the series information with its conference number."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        series = self.fetch(
-            "SELECT SeriesNumber, Conference, TeamHigherSeed, TeamLowerSeed "
-            f"FROM Series WHERE Year={round_info.year} "
-            f"AND Round={round_info.played_round}"
-        )
+        series = self.fetch("series_with_number", _round_parameters(round_info))
         if not series:
             return {}
         return {
@@ -327,71 +859,49 @@ class DataBase:  # pylint: disable=R0904
 
     def add_round_selections(self, selections: pd.DataFrame) -> None:
         """Add played round selections."""
-        individual_ids = self.get_individuals_with_ids()
+        individual_ids = self._individual_ids(selections.index.get_level_values(0))
         series_ids = self.get_series_ids(
             RoundInfo(
                 played_round=selections.attrs["Selection Round"],
                 year=selections.attrs["Year"],
             )
         )
-        data = [
+        data = (
             (
-                series_ids[tuple(series)],  # type: ignore[index]
+                series_ids[(conference, series)],
                 individual_ids[name],
-                selections["Team"][name][tuple(series)],
-                _convert_Int64_to_int(selections["Duration"][name][tuple(series)]),
-                selections["Player"][name][tuple(series)]
-                if "Player" in selections.columns
-                else None,
+                team,
+                duration,
+                player,
             )
-            for name, *series in selections.index
-        ]
-        self.commit("INSERT INTO SeriesSelections VALUES (?,?,?,?,?)", data)
+            for name, conference, series, team, duration, player in zip(
+                selections.index.get_level_values(0),
+                selections.index.get_level_values(1),
+                selections.index.get_level_values(2),
+                _object_values(selections["Team"]),
+                _durations(selections["Duration"]),
+                _players(selections),
+            )
+        )
+        self.commit("add_round_selections", data)
 
     def get_round_selections(self, round_info: RoundInfo) -> pd.DataFrame:
         """Return the selections of a played round."""
         check_year(round_info.year)
-        selections = pd.read_sql_query(
-            f"""
-            SELECT Ser.Conference, Ser.SeriesNumber,
-                Ser.TeamHigherSeed, Ser.TeamLowerSeed,
-                Ind.FirstName, Ind.LastName,
-                SS.Team, SS.Duration, SS.Player
-            FROM Individuals as Ind
-            LEFT JOIN (SeriesSelections as SS
-                Inner JOIN Series as Ser
-                ON Ser.YearRoundSeriesID = SS.YearRoundSeriesID)
-            ON Ind.IndividualID = SS.IndividualID
-            WHERE Ser.Year = {round_info.year}
-            AND Ser.Round = "{round_info.played_round}"
-            ORDER BY FirstName, LastName, Conference, SeriesNumber
-            """,
-            self._conn,
-        )
-        selections["Individual"] = [
-            utils.merge_name(list(name))
-            for name in zip(selections["FirstName"], selections["LastName"])
-        ]
-        selections["Series"] = [
-            create_series_name(higher_seed, lower_seed)
-            for higher_seed, lower_seed in zip(
-                selections["TeamHigherSeed"], selections["TeamLowerSeed"]
-            )
-        ]
-        return (
-            selections.set_index(["Individual", "Conference", "Series"])
-            .drop(
-                [
-                    "FirstName",
-                    "LastName",
-                    "SeriesNumber",
-                    "TeamHigherSeed",
-                    "TeamLowerSeed",
-                ],
-                axis="columns",
-            )
-            .astype({"Duration": "Int64"})
-        )
+        selections = self.read_frame("round_selections", _round_parameters(round_info))
+        return _round_selections_from_frame(selections)
+
+    def get_series_selections(
+        self, round_info: RoundInfo, series: tuple[str, str]
+    ) -> pd.DataFrame:
+        """Return the selections of a single series in a played round.
+
+        The series is the conference and name of the series.
+        """
+        check_year(round_info.year)
+        series_id = self.get_series_ids(round_info)[series]
+        selections = self.read_frame("series_selections", (series_id,))
+        return _round_selections_from_frame(selections)
 
     def add_round_results(self, results: pd.DataFrame) -> None:
         """Add played round results."""
@@ -401,50 +911,24 @@ class DataBase:  # pylint: disable=R0904
                 year=results.attrs["Year"],
             )
         )
-        data = [
-            (
-                series_ids[index],  # type: ignore[index]
-                results["Team"][index],
-                _convert_Int64_to_int(results["Duration"][index]),
-                results["Player"][index] if "Player" in results.columns else None,
-            )
-            for index in results.index
-        ]
-        complete_series_data = [series for series in data if series[2] is not None]
-        self.commit("INSERT INTO SeriesResults VALUES (?,?,?,?)", complete_series_data)
+        data = zip(
+            (series_ids[series] for series in results.index),
+            _object_values(results["Team"]),
+            _durations(results["Duration"]),
+            _players(results),
+        )
+        complete_series_data = (series for series in data if series[2] is not None)
+        self.commit("add_round_results", complete_series_data)
 
     def get_round_results(self, round_info: RoundInfo) -> pd.DataFrame:
         """Return the results of a played round."""
         check_year(round_info.year)
-        results = pd.read_sql_query(
-            f"""
-            SELECT Ser.Conference, Ser.SeriesNumber,
-                Ser.TeamHigherSeed, Ser.TeamLowerSeed,
-                SR.Team, SR.Duration, SR.Player
-            FROM (SeriesResults as SR
-                Inner JOIN Series as Ser
-                ON Ser.YearRoundSeriesID = SR.YearRoundSeriesID)
-            WHERE Ser.Year = {round_info.year}
-            AND Ser.Round = "{round_info.played_round}"
-            ORDER BY Conference, SeriesNumber
-            """,
-            self._conn,
-        )
-        results["Series"] = [
-            create_series_name(higher_seed, lower_seed)
-            for higher_seed, lower_seed in zip(
-                results["TeamHigherSeed"], results["TeamLowerSeed"]
-            )
-        ]
-        return (
-            results.set_index(["Conference", "Series"])
-            .drop(["TeamHigherSeed", "TeamLowerSeed", "SeriesNumber"], axis="columns")
-            .astype({"Duration": "Int64"})
-        )
+        results = self.read_frame("round_results", _round_parameters(round_info))
+        return _round_results_from_frame(results)
 
     def add_champions_selections(self, selections: pd.DataFrame) -> None:
         """Add the champions round selections."""
-        individual_ids = self.get_individuals_with_ids()
+        individual_ids = self._individual_ids(selections.index)
         stanley_cup_data = [
             (
                 individual_ids[name],
@@ -454,42 +938,15 @@ class DataBase:  # pylint: disable=R0904
             )
             for name in selections.index
         ]
-        self.commit(
-            "INSERT INTO StanleyCupSelections VALUES (?,?,?,?,?,?)", stanley_cup_data
-        )
+        self.commit("add_champions_selections", stanley_cup_data)
 
     def get_champions_selections(self, year: int) -> pd.DataFrame:
         """Return the champions round selections."""
         check_year(year)
-        champions = self.fetch(
-            "SELECT IndividualID, East, West, [Stanley Cup], Duration "
-            f"FROM StanleyCupSelections WHERE Year={year}"
+        champions = self.fetch("champions_selections", (year,))
+        return _champions_selections_from_rows(
+            champions, self._id_individuals(_row_ids(champions)), year
         )
-        if not champions:
-            return pd.DataFrame()
-        ids_with_individuals = self.get_ids_with_individuals()
-        df = (
-            pd.DataFrame(
-                {
-                    "Individual": [
-                        ids_with_individuals[int(row[0])] for row in champions
-                    ],
-                    "East": [row[1] for row in champions],
-                    "West": [row[2] for row in champions],
-                    "Stanley Cup": [row[3] for row in champions],
-                    "Duration": [
-                        int(row[4]) if row[4] is not None else None for row in champions
-                    ],
-                }
-            )
-            .astype({"Duration": "Int64"})
-            .set_index("Individual")
-        )
-        df.attrs = {
-            "Selection Round": "Champions",
-            "Year": year,
-        }
-        return df
 
     def add_finalists_results(self, results: pd.Series) -> None:
         """Add the Champion round finalist results."""
@@ -499,51 +956,29 @@ class DataBase:  # pylint: disable=R0904
                 *list(results[["East", "West"]]),
             )
         ]
-        self.commit(
-            "INSERT INTO StanleyCupResults (Year, East, West) VALUES (?,?,?)",
-            stanley_cup_data,
-        )
+        self.commit("add_finalists_results", stanley_cup_data)
 
     def add_stanley_cup_champion_results(self, results: pd.Series) -> None:
         """Add the Stanley Cup Champions result."""
         year = results.attrs["Year"]
         stanley_cup_data = [
-            (results["Stanley Cup"], _convert_Int64_to_int(results["Duration"]))
+            (
+                results["Stanley Cup"],
+                _convert_Int64_to_int(results["Duration"]),
+                year,
+            )
         ]
-        self.commit(
-            "UPDATE StanleyCupResults "
-            f"SET 'Stanley Cup' = ?, Duration = ? WHERE Year = {year}",
-            stanley_cup_data,
-        )
+        self.commit("add_stanley_cup_champion_results", stanley_cup_data)
 
     def get_champions_results(self, year: int) -> pd.Series:
         """Return the champions round results."""
         check_year(year)
-        champions = self.fetch(
-            "SELECT East, West, [Stanley Cup], Duration "
-            f"FROM StanleyCupResults WHERE Year={year}"
-        )
-        if not champions:
-            return _empty_series()
-        ser = pd.Series(
-            {
-                "East": champions[0][0],
-                "West": champions[0][1],
-                "Stanley Cup": champions[0][2],
-                "Duration": (
-                    np.int64(champions[0][3]) if champions[0][3] is not None else pd.NA
-                ),
-            }
-        )
-        ser.attrs = {
-            "Selection Round": "Champions",
-            "Year": year,
-        }
-        return ser
+        champions = self.fetch("champions_results", (year,))
+        return _champions_results_from_rows(champions, year)
 
     def add_overtime_selections(self, selections: pd.Series) -> None:
         """Add overtime selections."""
-        individual_ids = self.get_individuals_with_ids()
+        individual_ids = self._individual_ids(selections.index.astype(str))
         data = [
             (
                 individual_ids[str(individual)],
@@ -553,60 +988,33 @@ class DataBase:  # pylint: disable=R0904
             )
             for individual, selection in selections.items()
         ]
-        self.commit("INSERT INTO OvertimeSelections VALUES (?,?,?,?)", data)
+        self.commit("add_overtime_selections", data)
 
     def get_overtime_selections(self, round_info: RoundInfo) -> pd.Series:
         """Return the overtime selections."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        selections = pd.read_sql_query(
-            f"""
-            SELECT Ind.FirstName, Ind.LastName, OT.Overtime
-            FROM (Individuals as Ind
-                Inner JOIN OvertimeSelections as OT
-                ON OT.IndividualID = Ind.IndividualID)
-            WHERE OT.Year = {round_info.year}
-            AND OT.Round = "{round_info.played_round}"
-            """,
-            self._conn,
-        )
-        if selections.empty:
-            return _empty_series()
-        selections["Individual"] = [
-            utils.merge_name(list(name))
-            for name in zip(selections["FirstName"], selections["LastName"])
-        ]
-        return (
-            selections.drop(["FirstName", "LastName"], axis="columns")
-            .set_index("Individual")
-            .squeeze()
-            .sort_index()
-            .astype("str")
+        selections = self.read_frame(
+            "overtime_selections", _round_parameters(round_info)
         )
+        return _overtime_selections_from_frame(selections)
 
     def add_overtime_results(self, round_info: RoundInfo, result: str) -> None:
         """Add overtime results."""
         data = [(round_info.year, round_info.played_round, result)]
-        self.commit("INSERT INTO OvertimeResults VALUES (?,?,?)", data)
+        self.commit("add_overtime_results", data)
 
     def get_overtime_results(self, round_info: RoundInfo) -> str:
         """Return the overtime selections in a pandas dataframe"""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        results = self.fetch(
-            f"""
-            SELECT Overtime FROM OvertimeResults
-            WHERE Year = {round_info.year} AND Round = "{round_info.played_round}"
-            """
-        )
-        if not results:
-            return ""
-        return str(results[0][0])
+        results = self.fetch("overtime_results", _round_parameters(round_info))
+        return _overtime_results_from_rows(results)
 
     def add_other_points(self, other_points: pd.Series) -> None:
         """Add other points."""
         check_year(other_points.attrs["Year"])
-        individual_ids = self.get_individuals_with_ids()
+        individual_ids = self._individual_ids(other_points.index.astype(str))
         points_data = [
             (
                 other_points.attrs["Year"],
@@ -616,35 +1024,517 @@ class DataBase:  # pylint: disable=R0904
             )
             for individual, points in other_points.items()
         ]
-        self.commit("INSERT INTO OtherPoints VALUES (?,?,?,?)", points_data)
+        self.commit("add_other_points", points_data)
 
     def get_other_points(self, round_info: RoundInfo) -> pd.Series:
         """Return the other points."""
         check_year(round_info.year)
         check_played_round(round_info.year, round_info.played_round)
-        selections = pd.read_sql_query(
-            f"""
-            SELECT Ind.FirstName, Ind.LastName, OP.Points
-            FROM (Individuals as Ind
-                Inner JOIN OtherPoints as OP
-                ON OP.IndividualID = Ind.IndividualID)
-            WHERE OP.Year = {round_info.year}
-            AND OP.Round = "{round_info.played_round}"
-            """,
-            self._conn,
+        points = self.read_frame("other_points", _round_parameters(round_info))
+        return _other_points_from_frame(points)
+
+    def get_round_points(self, round_info: RoundInfo) -> pd.Series:
+        """Return the selection points of a played round scored in SQL.
+
+        Only the points systems awarding fixed points for a correct team,
+        length and 7 game series are supported. The points match those of
+        RoundPoints.selection.
+        """
+        check_year(round_info.year)
+        check_played_round(round_info.year, round_info.played_round)
+        weights = fixed_pick_points(round_info.year, round_info.played_round)
+        rows = self.fetch("round_points", weights + _round_parameters(round_info))
+        return _points_from_rows(rows, f"Round {round_info.played_round}")
+
+    def add_selection_points(self, round_info: RoundInfo, points: pd.Series) -> None:
+        """Add points to the stored selection points of individuals in a round."""
+        check_year(round_info.year)
+        check_played_round(round_info.year, round_info.played_round)
+        individual_ids = self._individual_ids(points.index.astype(str))
+        data = (
+            (
+                round_info.year,
+                round_info.played_round,
+                individual_ids[str(individual)],
+                int(value),
+            )
+            for individual, value in points.items()
         )
-        if selections.empty:
-            return _empty_series()
-        selections["Individual"] = [
-            utils.merge_name(list(name))
-            for name in zip(selections["FirstName"], selections["LastName"])
-        ]
-        return (
-            selections.drop(["FirstName", "LastName"], axis="columns")
-            .set_index("Individual")
-            .squeeze(axis="columns")
-            .sort_index()
+        self.commit("add_selection_points", data)
+
+    def get_running_totals(self, round_info: RoundInfo) -> pd.Series:
+        """Return the stored selection points of every individual in a round."""
+        check_year(round_info.year)
+        check_played_round(round_info.year, round_info.played_round)
+        rows = self.fetch("running_totals", _round_parameters(round_info))
+        return _points_from_rows(rows, f"Round {round_info.played_round}")
+
+    def replace_points(
+        self, year: int, selection_round: SelectionRound, points: pd.DataFrame
+    ) -> None:
+        """Replace the stored points of every individual in a selection round.
+
+        The points have a row for each individual and component, as in the
+        table returned by get_points. Missing points are stored as 0.
+        """
+        check_year(year)
+        individual_ids = self._individual_ids(points["Individual"].astype(str))
+        self.commit("delete_points", [(year, selection_round)])
+        data = (
+            (year, selection_round, individual_ids[str(individual)], component, value)
+            for individual, component, value in zip(
+                points["Individual"],
+                points["Component"],
+                points["Points"].fillna(0).astype(int).tolist(),
+            )
         )
+        self.commit("add_points", data)
+
+    def get_points(self, first_year: int, last_year: int) -> pd.DataFrame:
+        """Return the stored points of every round of a range of years.
+
+        The table has a row for each year, round, individual and component.
+        """
+        check_year(first_year)
+        points = self.read_frame("points", (first_year, last_year))
+        return _points_from_frame(points)
+
+    def get_standings(self, year: int) -> pd.Series:
+        """Return the total stored points of every individual in a year."""
+        check_year(year)
+        rows = self.fetch("standings", (year,))
+        return _points_from_rows(rows, "Total")
+
+    def load_season(self, year: int) -> "SeasonData":
+        """Return every table for a year in an in-memory snapshot.
+
+        Each table is read with a single query for the whole year.
+        """
+        return self.load_seasons(year, year)[year]
+
+    def load_seasons(self, first_year: int, last_year: int) -> dict[int, "SeasonData"]:
+        """Return a snapshot of every table for each year in a range.
+
+        Each table is read with a single query for all of the years.
+        """
+        check_year(first_year)
+        years = (first_year, last_year)
+        with self:
+            rows = {name: self.fetch(f"season_{name}", years) for name in SEASON_ROWS}
+            frames = {
+                name: self.read_frame(f"season_{name}", years) for name in SEASON_FRAMES
+            }
+            ids = (
+                _row_ids([row[2:] for row in rows["monikers"]])
+                | _row_ids([row[2:] for row in rows["preferences"]])
+                | _row_ids([row[1:] for row in rows["champions_selections"]])
+            )
+            individuals = MappingProxyType(dict(self._id_individuals(ids)))
+        return {
+            year: SeasonData(
+                year=year,
+                individuals=individuals,
+                monikers=_year_rows(rows["monikers"], year),
+                preferences=_year_rows(rows["preferences"], year),
+                series=_year_frame(frames["series"], year),
+                selections=_year_frame(frames["selections"], year),
+                results=_year_frame(frames["results"], year),
+                overtime_selections=_year_frame(frames["overtime_selections"], year),
+                overtime_results=_year_rows(rows["overtime_results"], year),
+                other_points=_year_frame(frames["other_points"], year),
+                champions_selections=_year_rows(rows["champions_selections"], year),
+                champions_results=_year_rows(rows["champions_results"], year),
+            )
+            for year in range(first_year, last_year + 1)
+        }
+
+
+@contextlib.contextmanager
+def open_database(
+    database_file: Path | None, database: DataBase | None = None
+) -> typing.Iterator[DataBase]:
+    """Yield the database given, or open one on the file and close it after."""
+    if database is not None:
+        yield database
+        return
+    database = DataBase(database_file)
+    try:
+        yield database
+    finally:
+        database.close()
+
+
+class ReadOnlyDataBase(DataBase):
+    """DataBase opened read-only.
+
+    Connections are opened with a `mode=ro` URI, so many readers can query the
+    database while another DataBase writes to it. The database must exist and
+    is never created or migrated.
+    """
+
+    read_only = True
+
+    def _initialize(self) -> None:
+        """Check that the database file exists."""
+        if not self._path.exists():
+            raise FileNotFoundError(f"The database {self._path} does not exist")
+
+
+@dataclass(frozen=True)
+class SeasonData:  # pylint: disable=R0902
+    """Immutable snapshot of every table for a year.
+
+    The getters mirror those of DataBase for the year, so a snapshot can be
+    used wherever a DataBase is read from.
+    """
+
+    year: int
+    individuals: Mapping[int, str]
+    monikers: tuple[tuple, ...]
+    preferences: tuple[tuple, ...]
+    series: pd.DataFrame
+    selections: pd.DataFrame
+    results: pd.DataFrame
+    overtime_selections: pd.DataFrame
+    overtime_results: tuple[tuple, ...]
+    other_points: pd.DataFrame
+    champions_selections: tuple[tuple, ...]
+    champions_results: tuple[tuple, ...]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        pass
+
+    def _check_round(self, round_info: RoundInfo) -> None:
+        """Check that the played round is in the year of the snapshot."""
+        check_year(round_info.year)
+        check_played_round(round_info.year, round_info.played_round)
+        self._check_year(round_info.year)
+
+    def _check_year(self, year: int) -> None:
+        """Check that the year is the year of the snapshot."""
+        if year != self.year:
+            raise YearError(f"The snapshot is for {self.year}, not {year}.")
+
+    def get_monikers(self, round_info: RoundInfo) -> Monikers:
+        """Return the moniker for played round."""
+        self._check_round(round_info)
+        rows = _round_rows(self.monikers, round_info.played_round)
+        return _monikers_from_rows(rows, self.individuals)
+
+    def get_preferences(self, round_info: RoundInfo) -> tuple[pd.Series, pd.Series]:
+        """Return the preferences for played round."""
+        self._check_round(round_info)
+        rows = _round_rows(self.preferences, round_info.played_round)
+        return _preferences_from_rows(rows, self.individuals)
+
+    def get_series(self, round_info: RoundInfo) -> pd.DataFrame:
+        """Return the series information for a played round."""
+        self._check_round(round_info)
+        return _series_from_frame(_round_frame(self.series, round_info.played_round))
+
+    def get_round_selections(self, round_info: RoundInfo) -> pd.DataFrame:
+        """Return the selections of a played round."""
+        self._check_round(round_info)
+        return _round_selections_from_frame(
+            _round_frame(self.selections, round_info.played_round)
+        )
+
+    def get_round_results(self, round_info: RoundInfo) -> pd.DataFrame:
+        """Return the results of a played round."""
+        self._check_round(round_info)
+        return _round_results_from_frame(
+            _round_frame(self.results, round_info.played_round)
+        )
+
+    def get_champions_selections(self, year: int) -> pd.DataFrame:
+        """Return the champions round selections."""
+        self._check_year(year)
+        return _champions_selections_from_rows(
+            list(self.champions_selections), self.individuals, year
+        )
+
+    def get_champions_results(self, year: int) -> pd.Series:
+        """Return the champions round results."""
+        self._check_year(year)
+        return _champions_results_from_rows(list(self.champions_results), year)
+
+    def get_overtime_selections(self, round_info: RoundInfo) -> pd.Series:
+        """Return the overtime selections."""
+        self._check_round(round_info)
+        return _overtime_selections_from_frame(
+            _round_frame(self.overtime_selections, round_info.played_round)
+        )
+
+    def get_overtime_results(self, round_info: RoundInfo) -> str:
+        """Return the overtime results."""
+        self._check_round(round_info)
+        rows = _round_rows(self.overtime_results, round_info.played_round)
+        return _overtime_results_from_rows(rows)
+
+    def get_other_points(self, round_info: RoundInfo) -> pd.Series:
+        """Return the other points."""
+        self._check_round(round_info)
+        return _other_points_from_frame(
+            _round_frame(self.other_points, round_info.played_round)
+        )
+
+
+DataSource = DataBase | SeasonData
+
+SEASON_ROWS = (
+    "monikers",
+    "preferences",
+    "overtime_results",
+    "champions_selections",
+    "champions_results",
+)
+SEASON_FRAMES = (
+    "series",
+    "selections",
+    "results",
+    "overtime_selections",
+    "other_points",
+)
+
+
+def _year_rows(rows: list[tuple], year: int) -> tuple[tuple, ...]:
+    """Return the rows of a year without their leading year column."""
+    return tuple(row[1:] for row in rows if row[0] == year)
+
+
+def _year_frame(frame: pd.DataFrame, year: int) -> pd.DataFrame:
+    """Return the rows of a year without the year column."""
+    return (
+        frame[frame["Year"] == year].drop("Year", axis="columns").reset_index(drop=True)
+    )
+
+
+def _round_rows(rows: tuple[tuple, ...], played_round: PlayedRound) -> list[tuple]:
+    """Return the rows of a played round without their leading round column."""
+    return [row[1:] for row in rows if row[0] == played_round]
+
+
+def _round_frame(frame: pd.DataFrame, played_round: PlayedRound) -> pd.DataFrame:
+    """Return the rows of a played round without the round column."""
+    return (
+        frame[frame["Round"] == played_round]
+        .drop("Round", axis="columns")
+        .reset_index(drop=True)
+    )
+
+
+def _row_ids(rows: list[tuple]) -> set[int]:
+    """Return the individual IDs in the first column of rows."""
+    return {int(row[0]) for row in rows}
+
+
+def _monikers_from_rows(
+    rows: list[tuple], ids_with_individuals: Mapping[int, str]
+) -> Monikers:
+    """Return the monikers from (IndividualID, Moniker) rows."""
+    return {
+        ids_with_individuals[int(individual_id)]: moniker
+        for individual_id, moniker in rows
+    }
+
+
+def _preferences_from_rows(
+    rows: list[tuple], ids_with_individuals: Mapping[int, str]
+) -> tuple[pd.Series, pd.Series]:
+    """Return the favourite and cheering teams from preferences rows."""
+    if not rows:
+        return _empty_series(), _empty_series()
+    favourite_team = pd.Series(
+        {
+            ids_with_individuals[int(individual_id)]: favourite_team
+            for individual_id, favourite_team, _ in rows
+        }
+    )
+    cheering_team = pd.Series(
+        {
+            ids_with_individuals[int(individual_id)]: cheering_team
+            for individual_id, _, cheering_team in rows
+        }
+    )
+    return favourite_team, cheering_team
+
+
+def _series_from_frame(series: pd.DataFrame) -> pd.DataFrame:
+    """Return the series information from the Series table columns."""
+    series = series.rename(
+        columns={
+            "SeriesNumber": "Series Number",
+            "TeamHigherSeed": "Higher Seed",
+            "TeamLowerSeed": "Lower Seed",
+            "PlayerHigherSeed": "Player on Higher Seed",
+            "PlayerLowerSeed": "Player on Lower Seed",
+        }
+    )
+    series.insert(
+        2,
+        "Name",
+        list(map(create_series_name, series["Higher Seed"], series["Lower Seed"])),
+    )
+    return series.set_index(["Conference", "Series Number"])
+
+
+def _round_selections_from_frame(selections: pd.DataFrame) -> pd.DataFrame:
+    """Return the played round selections from the queried columns."""
+    selections["Individual"] = [
+        utils.merge_name(list(name))
+        for name in zip(selections["FirstName"], selections["LastName"])
+    ]
+    selections["Series"] = [
+        create_series_name(higher_seed, lower_seed)
+        for higher_seed, lower_seed in zip(
+            selections["TeamHigherSeed"], selections["TeamLowerSeed"]
+        )
+    ]
+    return (
+        selections.set_index(["Individual", "Conference", "Series"])
+        .drop(
+            [
+                "FirstName",
+                "LastName",
+                "SeriesNumber",
+                "TeamHigherSeed",
+                "TeamLowerSeed",
+            ],
+            axis="columns",
+        )
+        .astype({"Duration": "Int64"})
+    )
+
+
+def _round_results_from_frame(results: pd.DataFrame) -> pd.DataFrame:
+    """Return the played round results from the queried columns."""
+    results["Series"] = [
+        create_series_name(higher_seed, lower_seed)
+        for higher_seed, lower_seed in zip(
+            results["TeamHigherSeed"], results["TeamLowerSeed"]
+        )
+    ]
+    return (
+        results.set_index(["Conference", "Series"])
+        .drop(["TeamHigherSeed", "TeamLowerSeed", "SeriesNumber"], axis="columns")
+        .astype({"Duration": "Int64"})
+    )
+
+
+def _champions_selections_from_rows(
+    champions: list[tuple], ids_with_individuals: Mapping[int, str], year: int
+) -> pd.DataFrame:
+    """Return the champions round selections from StanleyCupSelections rows."""
+    if not champions:
+        return pd.DataFrame()
+    df = (
+        pd.DataFrame(
+            {
+                "Individual": [ids_with_individuals[int(row[0])] for row in champions],
+                "East": [row[1] for row in champions],
+                "West": [row[2] for row in champions],
+                "Stanley Cup": [row[3] for row in champions],
+                "Duration": [
+                    int(row[4]) if row[4] is not None else None for row in champions
+                ],
+            }
+        )
+        .astype({"Duration": "Int64"})
+        .set_index("Individual")
+    )
+    df.attrs = {
+        "Selection Round": "Champions",
+        "Year": year,
+    }
+    return df
+
+
+def _champions_results_from_rows(champions: list[tuple], year: int) -> pd.Series:
+    """Return the champions round results from StanleyCupResults rows."""
+    if not champions:
+        return _empty_series()
+    ser = pd.Series(
+        {
+            "East": champions[0][0],
+            "West": champions[0][1],
+            "Stanley Cup": champions[0][2],
+            "Duration": (
+                np.int64(champions[0][3]) if champions[0][3] is not None else pd.NA
+            ),
+        }
+    )
+    ser.attrs = {
+        "Selection Round": "Champions",
+        "Year": year,
+    }
+    return ser
+
+
+def _overtime_selections_from_frame(selections: pd.DataFrame) -> pd.Series:
+    """Return the overtime selections from the queried columns."""
+    if selections.empty:
+        return _empty_series()
+    selections["Individual"] = [
+        utils.merge_name(list(name))
+        for name in zip(selections["FirstName"], selections["LastName"])
+    ]
+    return (
+        selections.drop(["FirstName", "LastName"], axis="columns")
+        .set_index("Individual")
+        .squeeze()
+        .sort_index()
+        .astype("str")
+    )
+
+
+def _overtime_results_from_rows(results: list[tuple]) -> str:
+    """Return the overtime result from OvertimeResults rows."""
+    if not results:
+        return ""
+    return str(results[0][0])
+
+
+def _other_points_from_frame(points: pd.DataFrame) -> pd.Series:
+    """Return the other points from the queried columns."""
+    if points.empty:
+        return _empty_series()
+    points["Individual"] = [
+        utils.merge_name(list(name))
+        for name in zip(points["FirstName"], points["LastName"])
+    ]
+    return (
+        points.drop(["FirstName", "LastName"], axis="columns")
+        .set_index("Individual")
+        .squeeze(axis="columns")
+        .sort_index()
+    )
+
+
+def _points_from_frame(points: pd.DataFrame) -> pd.DataFrame:
+    """Return the stored points from the queried columns."""
+    points["Individual"] = [
+        utils.merge_name(list(name))
+        for name in zip(points["FirstName"], points["LastName"])
+    ]
+    return points.reindex(columns=POINTS_COLUMNS).astype({"Points": "Int64"})
+
+
+def _points_from_rows(rows: list[tuple], name: str) -> pd.Series:
+    """Return the points from (FirstName, LastName, Points) rows, highest first."""
+    points = {utils.merge_name([first, last]): total for first, last, total in rows}
+    return (
+        pd.Series(points, index=points, name=name)
+        .sort_values(ascending=False)
+        .astype("Int64")
+    )
+
+
+def _round_parameters(round_info: RoundInfo) -> tuple[int, PlayedRound]:
+    """Return the bound parameters selecting a played round."""
+    return round_info.year, round_info.played_round
 
 
 def _convert_Int64_to_int(duration) -> int | None:  # pylint: disable=C0103
@@ -652,6 +1542,24 @@ def _convert_Int64_to_int(duration) -> int | None:  # pylint: disable=C0103
     return int(duration) if not isinstance(duration, type(pd.NA)) else None
 
 
+def _object_values(column: pd.Series) -> list:
+    """Return the values of a column as Python objects."""
+    return column.to_numpy(dtype=object).tolist()
+
+
+def _durations(column: pd.Series) -> list[int | None]:
+    """Return a column of durations as integers, with None for missing values."""
+    durations = column.astype("Int64")
+    return durations.astype(object).where(durations.notna(), None).tolist()
+
+
+def _players(frame: pd.DataFrame) -> list | itertools.repeat:
+    """Return the players of a frame, or None for each row without a column."""
+    if "Player" in frame.columns:
+        return _object_values(frame["Player"])
+    return itertools.repeat(None)
+
+
 def check_year(year: int) -> None:
     """Check if the year is valid."""
     if year < 2006:
@@ -688,6 +1596,25 @@ def txt_files_in_dir(path: Path) -> list[Path]:
     return list(path.glob("*.txt"))
 
 
+def migration_files(path: Path) -> list[tuple[int, Path]]:
+    """List the migration files in a directory with their versions, in order.
+
+    Migration files are named with a leading version number, eg 0001_name.sql.
+    """
+    migrations = [(int(file.name.split("_")[0]), file) for file in path.glob("*.sql")]
+    return sorted(migrations)
+
+
+def _file_uri(path: Path) -> str:
+    """Return the URI of a database file without its query."""
+    return f"file:{urllib.parse.quote(str(path))}"
+
+
+def _schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database."""
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
 def _check_length_of_last_name(last_name: str) -> None:
     """Check the length of the last name."""
     if len(last_name) > 1:
@@ -4,16 +4,14 @@ import os
 from jinja2 import Environment, FileSystemLoader
 from numpy import array
 from pandas import NA, isna
-from sympy import latex, symbols
-from sympy.utilities.lambdify import lambdify
 
-from deepwellcup.points.points_systems import points_system
+from deepwellcup.points.points_systems import duration_points, points_system
 from deepwellcup.utils import dirs, utils
 from deepwellcup.utils.nhl_teams import lengthen_team_name as ltn
 from deepwellcup.utils.nhl_teams import shorten_team_name as stn
 
-from .database import DataBase
-from .playoff_round import PlayoffRound
+from .database import DataSource
+from .season import Season, as_season
 
 
 class Latex:
@@ -23,13 +21,14 @@ class Latex:
         self,
         year,
         playoff_round,
-        database: DataBase,
+        database: DataSource | Season,
     ):
         self._year = year
         self._playoff_round = playoff_round
-        self._round_facts = PlayoffRound(year, playoff_round, database)
+        season = as_season(year, database)
+        self._round_facts = season[playoff_round]
         if playoff_round != "Q":
-            self._champions_info = PlayoffRound(year, "Champions", database)
+            self._champions_info = season["Champions"]
         else:
             self._champions_info = None  # type: ignore
         self._system = points_system(self.year)
@@ -415,9 +414,8 @@ class Latex:
             else:
                 correct_handle = "f_correct"
                 incorrect_handle = "f_incorrect"
-            C, P = symbols("C P")  # pylint: disable=C0103,W0612
-            correct = latex(eval(system[correct_handle]))  # pylint: disable=W0123
-            incorrect = latex(eval(system[incorrect_handle]))  # pylint: disable=W0123
+            correct = _formula_to_latex(system[correct_handle])
+            incorrect = _formula_to_latex(system[incorrect_handle])
             descriptor = f"""        Let $C$ be the correct number of games\\\\
         Let $P$ be the predicted number of games\\\\
         If correct team chosen:	   & ${correct}$\\\\
@@ -539,28 +537,20 @@ class Latex:
         system = self._system
         if "f_correct" not in system:
             return None
-        if self.playoff_round == "Q":
-            handle = "f_correct_round_Q"
-        else:
-            handle = "f_correct"
-        C, P = symbols("C P")  # pylint: disable=C0103
-        f_correct = lambdify((C, P), system[handle], "numpy")
-        return self._points_table(f_correct)
+        return self._points_table(
+            duration_points(self.year, self.playoff_round).correct
+        )
 
     def _incorrect_points_table(self):
         """Create the points table for the incorrectly selected team"""
         system = self._system
         if "f_incorrect" not in system:
             return None
-        if self.playoff_round == "Q":
-            handle = "f_incorrect_round_Q"
-        else:
-            handle = "f_incorrect"
-        C, P = symbols("C P")  # pylint: disable=C0103
-        f_incorrect = lambdify((C, P), system[handle], "numpy")
-        return self._points_table(f_incorrect)
+        return self._points_table(
+            duration_points(self.year, self.playoff_round).incorrect
+        )
 
-    def _points_table(self, func):
+    def _points_table(self, table):
         """Return the table of points per predicted and correct series duration"""
         if self.playoff_round == "Q":
             return (
@@ -568,45 +558,37 @@ class Latex:
         & & 3 & 4 & 5\\\cline{2-4}"""
                 + "\n"
                 + r"        \parbox[t]{2mm}{\multirow{3}{*}{\rotatebox[origin=c]{90}{Correct}}}"  # noqa: E501, pylint: disable=C0301
-                + f" & 3 & {self._make_points_string(func, 3)}"
+                + f" & 3 & {self._make_points_string(table, 3)}"
                 + r"\\"
                 + "\n"
-                + f"        & 4 & {self._make_points_string(func, 4)}"
+                + f"        & 4 & {self._make_points_string(table, 4)}"
                 + r"\\"
                 + "\n"
-                + f"        & 5 & {self._make_points_string(func, 5)}"
+                + f"        & 5 & {self._make_points_string(table, 5)}"
             )
         return (
             r"""        \mccn{2}{} & \mccn{4}{Predicted}\\
         & & 4 & 5 & 6 & 7\\\cline{2-6}"""
             + "\n"
             + r"        \parbox[t]{2mm}{\multirow{4}{*}{\rotatebox[origin=c]{90}{Correct}}}"  # noqa: E501, pylint: disable=C0301
-            + f" & 4 & {self._make_points_string(func, 4)}"
+            + f" & 4 & {self._make_points_string(table, 4)}"
             + r"\\"
             + "\n"
-            + f"        & 5 & {self._make_points_string(func, 5)}"
+            + f"        & 5 & {self._make_points_string(table, 5)}"
             + r"\\"
             + "\n"
-            + f"        & 6 & {self._make_points_string(func, 6)}"
+            + f"        & 6 & {self._make_points_string(table, 6)}"
             + r"\\"
             + "\n"
-            + f"        & 7 & {self._make_points_string(func, 7)}"
+            + f"        & 7 & {self._make_points_string(table, 7)}"
         )
 
-    def _make_points_string(self, func, correct_games):
+    def _make_points_string(self, table, correct_games):
         """Create the string for the points for a specific series duration"""
-        return " & ".join(
-            func(
-                correct_games,
-                array(
-                    utils.RoundInfo(
-                        self.playoff_round, self.year
-                    ).series_duration_options
-                ),
-            )
-            .astype(str)
-            .tolist()
+        predicted_games = array(
+            utils.RoundInfo(self.playoff_round, self.year).series_duration_options
         )
+        return " & ".join(table[correct_games, predicted_games].astype(str).tolist())
 
     @property
     def blank(self):
@@ -625,3 +607,11 @@ def shorten_player_name(name):
     last_name = name.split(" ")[1]
     num_letters = min(len(last_name), 7)
     return last_name[:num_letters]
+
+
+def _formula_to_latex(formula: str) -> str:
+    """Return the LaTeX math of a points formula."""
+    # sympy is slow to import and is only needed to render formulas
+    from sympy import latex, sympify  # pylint: disable=C0415
+
+    return latex(sympify(formula))
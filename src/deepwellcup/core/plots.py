@@ -5,12 +5,11 @@ import matplotlib.pyplot as plt  # type: ignore[import-untyped]
 import pandas as pd
 from matplotlib import patches, rc
 
-from deepwellcup.points.points import RoundPoints
 from deepwellcup.points.points_systems import points_system
 from deepwellcup.utils import dirs
-from deepwellcup.utils.round_data import RoundData
 
-from .database import DataBase
+from .database import DataSource
+from .season import Season, as_season
 
 # set font to look like Latex
 font = {"family": "serif", "size": 12}
@@ -23,7 +22,7 @@ class Plots:  # pylint: disable=R0902
     def __init__(  # pylint: disable=R0913
         self,
         year,
-        database: DataBase,
+        database: DataSource | Season,
         max_round=4,
         plot_champions=True,
         save=False,
@@ -34,7 +33,7 @@ class Plots:  # pylint: disable=R0902
         self.plot_champions = plot_champions
         self.save = save
         self.show = show
-        self._database = database
+        self._season = as_season(year, database)
         self._points_system = points_system(year)
         self._total_points = self._create_table("total")
         self._other_points = self._create_table("other")
@@ -124,13 +123,11 @@ class Plots:  # pylint: disable=R0902
 
     def _add_column_to_table(self, rnd, category):
         """Modify Series to be the appropriate structure for making a Dataframe."""
-        round_data = RoundData(self.year, rnd, self._database)
-        points = RoundPoints(round_data)
-        column = getattr(points, category)
+        column = getattr(self._season[rnd].points, category)
         if column is None:
             return pd.Series(name=self.rounds_to_plot[rnd], dtype="int64")
         if category == "other":
-            column.name = self.rounds_to_plot[rnd]
+            return column.rename(self.rounds_to_plot[rnd])
         return column
 
     def _create_table(self, category):
@@ -0,0 +1,75 @@
+"""Hold every playoff round in a year."""
+from dataclasses import dataclass, field
+
+from deepwellcup.utils.round_data import SelectionRoundError
+from deepwellcup.utils.utils import SelectionRound, YearInfo
+
+from .database import (
+    DataBase,
+    DataSource,
+    SeasonData,
+    YearError,
+)
+from .playoff_round import PlayoffRound
+
+
+@dataclass
+class Season:
+    """Every playoff round in a year, sharing one snapshot of the year."""
+
+    year: int
+    database: DataSource
+    data: SeasonData = field(init=False)
+    _rounds: dict[SelectionRound, PlayoffRound] = field(
+        init=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        self.data = self._read()
+
+    def _read(self) -> SeasonData:
+        """Return the snapshot of the year."""
+        if isinstance(self.database, DataBase):
+            return self.database.read_season(self.year)
+        if self.database.year != self.year:
+            raise YearError(
+                f"The snapshot is for {self.database.year}, not {self.year}."
+            )
+        return self.database
+
+    def reload(self) -> None:
+        """Read the database again and discard the rounds built from it."""
+        self.data = self._read()
+        self._rounds.clear()
+
+    @property
+    def selection_rounds(self) -> tuple[SelectionRound, ...]:
+        """Return the selection rounds of the year."""
+        return YearInfo(self.year).selection_rounds
+
+    def __getitem__(self, selection_round: SelectionRound) -> PlayoffRound:
+        if selection_round not in self.selection_rounds:
+            raise SelectionRoundError(
+                f"{selection_round} is not a selection round in {self.year}."
+            )
+        if selection_round not in self._rounds:
+            self._rounds[selection_round] = PlayoffRound(
+                self.year, selection_round, self.data
+            )
+        return self._rounds[selection_round]
+
+    def rounds(self) -> dict[SelectionRound, PlayoffRound]:
+        """Return the playoff round of every selection round in the year."""
+        return {
+            selection_round: self[selection_round]
+            for selection_round in self.selection_rounds
+        }
+
+
+def as_season(year: int, database: "DataSource | Season") -> Season:
+    """Return the season of a year, reading it when a data source is given."""
+    if isinstance(database, Season):
+        if database.year != year:
+            raise YearError(f"The season is for {database.year}, not {year}.")
+        return database
+    return Season(year, database)
@@ -14,3 +14,12 @@ table_files=($(ls $DATABASE_DIR/*.txt))
 for file in "${table_files[@]}"; do
     $DATABASE_DIR/add_table.sh $db_file $file
 done
+
+migration_files=($(ls $DATABASE_DIR/migrations/*.sql))
+for file in "${migration_files[@]}"; do
+    version=$(basename $file | cut -d_ -f1)
+    $DATABASE_DIR/add_table.sh $db_file $file
+    sqlite3 $db_file "PRAGMA user_version = $((10#$version))"
+done
+
+sqlite3 $db_file "PRAGMA journal_mode = WAL"
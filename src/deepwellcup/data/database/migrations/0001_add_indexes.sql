@@ -0,0 +1,17 @@
+-- Secondary indexes for lookups that the primary keys do not cover.
+-- Series already has a unique (Year, Round, Conference, SeriesNumber) index,
+-- so extend it with the team names to cover the series lookups.
+CREATE INDEX IF NOT EXISTS SeriesYearRoundTeams
+    ON Series (Year, Round, Conference, SeriesNumber, TeamHigherSeed, TeamLowerSeed);
+CREATE INDEX IF NOT EXISTS SeriesSelectionsIndividual
+    ON SeriesSelections (IndividualID);
+CREATE INDEX IF NOT EXISTS StanleyCupSelectionsYear
+    ON StanleyCupSelections (Year);
+CREATE INDEX IF NOT EXISTS OvertimeSelectionsIndividual
+    ON OvertimeSelections (IndividualID);
+CREATE INDEX IF NOT EXISTS OtherPointsIndividual
+    ON OtherPoints (IndividualID);
+CREATE INDEX IF NOT EXISTS PreferencesIndividual
+    ON Preferences (IndividualID);
+CREATE INDEX IF NOT EXISTS MonikersIndividual
+    ON Monikers (IndividualID);
@@ -0,0 +1,20 @@
+-- Points of each individual in each selection round by component, stored as
+-- the results and other points of the round are recorded. The "Selection"
+-- rows of a played round are its running totals, updated as each series
+-- result is recorded.
+CREATE TABLE IF NOT EXISTS Points (
+    Year            INTEGER (4) NOT NULL,
+    Round           INTEGER (1) NOT NULL,
+    IndividualID    INTEGER     REFERENCES Individuals (IndividualID)
+                                NOT NULL,
+    Component       VARCHAR (20) NOT NULL,
+    Points          INTEGER     NOT NULL,
+    PRIMARY KEY (
+        Year,
+        Round,
+        IndividualID,
+        Component
+    )
+);
+CREATE INDEX IF NOT EXISTS PointsIndividual
+    ON Points (IndividualID);
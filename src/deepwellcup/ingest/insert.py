@@ -1,6 +1,11 @@
 """Insert selections into the database."""
+import pandas as pd
+
 from deepwellcup.core.database import DataBase
-from deepwellcup.utils.utils import RoundInfo
+from deepwellcup.points.history import round_points
+from deepwellcup.points.points import series_points
+from deepwellcup.points.points_systems import points_system
+from deepwellcup.utils.utils import RoundInfo, SelectionRound
 
 from .parse_files.files import FileOtherPoints, FileResults, FileSelections
 
@@ -28,7 +33,7 @@ class InsertSelections:
 
     def update_selections(self) -> None:
         """Add all selections."""
-        with self.database:
+        with self.database.transaction():
             if self.selections.selection_round == "Champions":
                 self.add_new_individuals()
                 self.add_champions_selections()
@@ -138,26 +143,54 @@ class InsertResults:
 
     def update_played_round_results(self) -> None:
         """Add played round results."""
-        with self.database:
+        with self.database.transaction():
             self.add_round_results()
             self.add_overtime_results()
 
+    def update_series_result(self, series: str) -> None:
+        """Add the result of a single series and its points to the running totals."""
+        with self.database.transaction():
+            self.add_series_result(series)
+
     def update_champions_finalists_results(self) -> None:
         """Add champions finalists results."""
-        with self.database:
+        with self.database.transaction():
             self.add_finalists_results()
 
     def update_stanley_cup_champion_results(self) -> None:
         """Add Stanley Cup champion result."""
-        with self.database:
+        with self.database.transaction():
             self.add_stanley_cup_champion_results()
 
     def add_round_results(self) -> None:
-        """Add round results."""
+        """Add the round results of the series without a recorded result."""
         if self.results.selection_round == "Champions":
             return
-        self.database.add_round_results(
-            self.results.results()  # type: ignore[arg-type]
+        results: pd.DataFrame = self.results.results()  # type: ignore[assignment]
+        recorded = self.database.get_round_results(_round_info(results)).index
+        self.database.add_round_results(results[~results.index.isin(recorded)])
+
+    def add_series_result(self, series: str) -> None:
+        """Add the result of a series and add its points to the stored points.
+
+        Only the selections of the series are scored, so the work is the same
+        for every series of the playoffs.
+        """
+        if self.results.selection_round == "Champions":
+            return
+        results: pd.DataFrame = self.results.results()  # type: ignore[assignment]
+        result = results[
+            (results.index.get_level_values("Series") == series)
+            & results["Duration"].notna()
+        ]
+        if result.empty:
+            raise ValueError(f"There is no result of the {series} series.")
+        round_info = _round_info(result)
+        self.database.add_round_results(result)
+        stored = self.database.get_round_results(round_info).loc[[result.index[0]]]
+        selections = self.database.get_series_selections(round_info, result.index[0])
+        self.database.add_selection_points(
+            round_info, _individual_points(selections, stored, round_info)
         )
 
     def add_finalists_results(self) -> None:
@@ -209,7 +242,7 @@ class InsertOtherPoints:
 
     def update_other_points(self) -> None:
         """Add other points."""
-        with self.database:
+        with self.database.transaction():
             self.add_new_individuals()
             self.add_other_points()
 
@@ -222,6 +255,30 @@ class InsertOtherPoints:
         self.database.add_other_points(self.other_points.points())
 
 
+def _round_info(results: pd.DataFrame) -> RoundInfo:
+    """Return the round of the results."""
+    return RoundInfo(
+        played_round=results.attrs["Selection Round"], year=results.attrs["Year"]
+    )
+
+
+def _individual_points(
+    selections: pd.DataFrame, results: pd.DataFrame, round_info: RoundInfo
+) -> pd.Series:
+    """Return the series points of each individual."""
+    points = series_points(
+        selections, results, points_system(round_info.year), round_info
+    )
+    return points.groupby(level="Individual").sum()
+
+
+def add_points(database: DataBase, year: int, selection_round: SelectionRound) -> None:
+    """Replace the stored points of the round with those scored now."""
+    database.replace_points(
+        year, selection_round, round_points(database, year, selection_round)
+    )
+
+
 def add_new_individuals(individuals: list[str], database: DataBase) -> None:
     """Add new individuals."""
     new_individuals = sorted(list(set(individuals) - set(database.get_individuals())))
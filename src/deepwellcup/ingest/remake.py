@@ -1,6 +1,8 @@
 """Remake everything."""
 from argparse import ArgumentParser
 
+from deepwellcup.core.database import DataBase
+from deepwellcup.points import points_systems
 from deepwellcup.utils import utils
 from deepwellcup.utils.utils import DataStores
 
@@ -12,14 +14,29 @@ from .update_selections import update_selections
 def multi_year_remake(
     years: int | list[int],
     datastores: DataStores = DataStores(None, None),
+    in_memory: bool = False,
 ) -> None:
-    """Remake the database, figures and tables."""
+    """Remake the database, figures and tables.
+
+    With in_memory, the database is built in memory and only written to its
+    file once every year has been remade.
+    """
+    points_systems.precompile()
+    database = DataBase(datastores.database, in_memory=in_memory)
     for year in _parse_year_inputs(years):
         print(f"Starting {year} ... ", end="", flush=True)
         for played_round in utils.YearInfo(year).played_rounds:
-            update_selections(year, played_round, datastores)
-            update_results(year, played_round, datastores)
+            update_selections(year, played_round, datastores, database)
+            update_results(year, played_round, datastores, database)
         print("Finished")
+    if in_memory:
+        database.save()
+    counts = database.statement_counts()
+    print(
+        f"Statements: {counts.repeated} repeated, {counts.first} first runs, "
+        f"{database.connections_opened} connections opened"
+    )
+    database.close()
 
 
 def _parse_year_inputs(input_years: int | list[int]) -> list:
@@ -54,6 +71,11 @@ def parse_arguments() -> ArgumentParser:
         help="year extrema to remake",
         required=True,
     )
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="build the database in memory and write it to disk at the end",
+    )
     add_database_option(parser)
     add_raw_data_dir_option(parser)
     return parser
@@ -67,6 +89,7 @@ def main() -> None:
     multi_year_remake(
         years=args.years,
         datastores=datastores,
+        in_memory=args.in_memory,
     )
 
 
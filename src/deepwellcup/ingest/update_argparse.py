@@ -57,6 +57,15 @@ def add_raw_data_dir_option(parser: ArgumentParser) -> None:
     )
 
 
+def add_series_option(parser: ArgumentParser) -> None:
+    """Add series flag to parser."""
+    parser.add_argument(
+        "-s",
+        "--series",
+        help="Series to add the result of, eg TOR-BOS, instead of the whole round",
+    )
+
+
 def modify_and_check_arguments(args: Namespace) -> Namespace:
     """Check and modify arguments."""
     if args.playoff_round.isdigit():
@@ -1,38 +1,100 @@
 """End of round updates and file generation."""
-from deepwellcup.core.database import DataBase
+import pandas as pd
+
+from deepwellcup.core.database import DataBase, open_database
 from deepwellcup.core.plots import Plots
-from deepwellcup.utils.utils import DataStores, PlayedRound, SelectionRound
+from deepwellcup.core.season import Season
+from deepwellcup.points.elimination import Elimination, previous_points
+from deepwellcup.utils.utils import (
+    DataStores,
+    PlayedRound,
+    RoundInfo,
+    SelectionRound,
+)
 
 from .files import OtherPointsFile, SelectionsFile
-from .insert import InsertOtherPoints, InsertResults
+from .insert import InsertOtherPoints, InsertResults, add_points
 from .parse_files.files import FileOtherPoints, FileResults
-from .update_argparse import modify_and_check_arguments, parse_arguments
+from .update_argparse import (
+    add_series_option,
+    modify_and_check_arguments,
+    parse_arguments,
+)
 
 
 def update_results(
     year: int,
     played_round: PlayedRound,
     datastores: DataStores = DataStores(None, None),
-) -> None:
-    """Update database with results and create the standings plot."""
-    _insert_data(year, played_round, datastores)
-    _make_plots(year, played_round, DataBase(datastores.database))
+    database: DataBase | None = None,
+) -> pd.DataFrame:
+    """Update database with results and create the standings plot.
+
+    Return the maximum total and elimination of every individual.
+    """
+    with open_database(datastores.database, database) as opened:
+        insert_data(year, played_round, datastores, opened)
+        season = Season(year, opened)
+        _make_plots(played_round, season)
+        return _elimination(played_round, season)
+
 
+def update_series_result(
+    year: int,
+    played_round: PlayedRound,
+    series: str,
+    datastores: DataStores = DataStores(None, None),
+    database: DataBase | None = None,
+) -> pd.Series:
+    """Add the result of a single series and return the running totals.
 
-def _insert_data(year: int, played_round: PlayedRound, datastores: DataStores) -> None:
-    """Insert data."""
-    _insert_results(year, played_round, datastores)
-    _insert_other_points(year, played_round, datastores)
-    if played_round == 3:
-        _insert_results(year, "Champions", datastores, champions="finalists")
-    if played_round == 4:
-        _insert_results(year, "Champions", datastores, champions="champion")
+    Only the points of the series are added to the stored running totals of
+    the round, so the standings are not recomputed and no plots are made.
+    """
+    results = FileResults(
+        SelectionsFile(
+            year=year,
+            selection_round=played_round,
+            directory=datastores.raw_data_directory,
+        )
+    )
+    with open_database(datastores.database, database) as opened:
+        InsertResults(results=results, database=opened).update_series_result(series)
+        with opened as db:
+            return db.get_running_totals(
+                RoundInfo(played_round=played_round, year=year)
+            )
+
+
+def insert_data(
+    year: int,
+    played_round: PlayedRound,
+    datastores: DataStores,
+    database: DataBase | None = None,
+) -> None:
+    """Insert data and store the points of the round once all of it is in."""
+    with open_database(datastores.database, database) as opened:
+        with opened.transaction():
+            _insert_results(year, played_round, datastores, opened)
+            _insert_other_points(year, played_round, datastores, opened)
+            add_points(opened, year, played_round)
+            if played_round == 3:
+                _insert_results(
+                    year, "Champions", datastores, opened, champions="finalists"
+                )
+                add_points(opened, year, "Champions")
+            if played_round == 4:
+                _insert_results(
+                    year, "Champions", datastores, opened, champions="champion"
+                )
+                add_points(opened, year, "Champions")
 
 
 def _insert_results(
     year: int,
     selection_round: SelectionRound,
     datastores: DataStores,
+    database: DataBase,
     champions: str = "",
 ) -> None:
     """Insert results."""
@@ -45,18 +107,19 @@ def _insert_results(
     )
     insert = InsertResults(
         results=results,
-        database=DataBase(datastores.database),
+        database=database,
     )
     if selection_round == "Champions":
         if champions == "finalists":
             insert.update_champions_finalists_results()
         if champions == "champion":
             insert.update_stanley_cup_champion_results()
+        return
     insert.update_played_round_results()
 
 
 def _insert_other_points(
-    year: int, played_round: PlayedRound, datastores: DataStores
+    year: int, played_round: PlayedRound, datastores: DataStores, database: DataBase
 ) -> None:
     """Insert other points."""
     other_points_file = OtherPointsFile(
@@ -66,16 +129,16 @@ def _insert_other_points(
         other_points = FileOtherPoints(other_points_file)
         insert = InsertOtherPoints(
             other_points=other_points,
-            database=DataBase(datastores.database),
+            database=database,
         )
         insert.update_other_points()
 
 
-def _make_plots(year: int, played_round: PlayedRound, database: DataBase) -> None:
+def _make_plots(played_round: PlayedRound, season: Season) -> None:
     """Make plots."""
     plots = Plots(
-        year,
-        database=database,
+        season.year,
+        database=season,
         max_round=played_round,
         save=True,
     )
@@ -83,17 +146,37 @@ def _make_plots(year: int, played_round: PlayedRound, database: DataBase) -> Non
     plots.close()
 
 
+def _elimination(played_round: PlayedRound, season: Season) -> pd.DataFrame:
+    """Return the maximum total and elimination of every individual."""
+    elimination = Elimination(
+        season[played_round].round_data,
+        previous_points(season.year, played_round, season.data),
+    )
+    return elimination.summary
+
+
 def main():
     """Main argument processing"""
     parser = parse_arguments()
+    add_series_option(parser)
     args = parser.parse_args()
     args = modify_and_check_arguments(args)
     datastores = DataStores(args.raw_data_directory, args.database)
-    update_results(
+    if args.series:
+        totals = update_series_result(
+            args.year,
+            args.playoff_round,
+            args.series,
+            datastores=datastores,
+        )
+        print(totals.to_string())
+        return
+    summary = update_results(
         args.year,
         args.playoff_round,
         datastores=datastores,
     )
+    print(summary.to_string())
 
 
 if __name__ == "__main__":
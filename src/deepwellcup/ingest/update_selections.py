@@ -1,6 +1,7 @@
 """Start of round updates and file generation."""
-from deepwellcup.core.database import DataBase
+from deepwellcup.core.database import DataBase, open_database
 from deepwellcup.core.latex import Latex
+from deepwellcup.core.season import Season
 from deepwellcup.utils.utils import DataStores, PlayedRound, SelectionRound
 
 from .files import SelectionsFile
@@ -13,21 +14,33 @@ def update_selections(
     year: int,
     played_round: PlayedRound,
     datastores: DataStores = DataStores(None, None),
+    database: DataBase | None = None,
 ) -> None:
     """Update database with selections and create the selections table."""
-    insert_data(year, played_round, datastores)
-    make_tables(year, played_round, DataBase(datastores.database))
+    with open_database(datastores.database, database) as opened:
+        insert_data(year, played_round, datastores, opened)
+        make_tables(year, played_round, opened)
 
 
-def insert_data(year: int, played_round: PlayedRound, datastores: DataStores) -> None:
+def insert_data(
+    year: int,
+    played_round: PlayedRound,
+    datastores: DataStores,
+    database: DataBase | None = None,
+) -> None:
     """Insert data."""
-    insert_selections(year, played_round, datastores)
-    if played_round == 1:
-        insert_selections(year, "Champions", datastores)
+    with open_database(datastores.database, database) as opened:
+        with opened.transaction():
+            insert_selections(year, played_round, datastores, opened)
+            if played_round == 1:
+                insert_selections(year, "Champions", datastores, opened)
 
 
 def insert_selections(
-    year: int, selection_round: SelectionRound, datastores: DataStores
+    year: int,
+    selection_round: SelectionRound,
+    datastores: DataStores,
+    database: DataBase | None = None,
 ) -> None:
     """Insert selections."""
     selections = FileSelections(
@@ -37,16 +50,17 @@ def insert_selections(
             directory=datastores.raw_data_directory,
         )
     )
-    insert = InsertSelections(
-        selections=selections,
-        database=DataBase(datastores.database),  # type: ignore
-    )
-    insert.update_selections()
+    with open_database(datastores.database, database) as opened:
+        insert = InsertSelections(
+            selections=selections,
+            database=opened,  # type: ignore
+        )
+        insert.update_selections()
 
 
 def make_tables(year: int, played_round: PlayedRound, database: DataBase) -> None:
     """Make selections tables file."""
-    latex = Latex(year, played_round, database)
+    latex = Latex(year, played_round, Season(year, database))
     latex.make_table()
     latex.build_pdf()
 
@@ -0,0 +1,57 @@
+"""Check the stored points against the points scored now."""
+import sys
+from argparse import ArgumentParser
+
+import pandas as pd
+
+from deepwellcup.core.database import open_database
+from deepwellcup.points.history import compare_points
+from deepwellcup.points.points_systems import FIRST_YEAR, LAST_YEAR
+from deepwellcup.utils.utils import DataStores
+
+from .update_argparse import add_database_option
+
+
+def verify_points(
+    first_year: int = FIRST_YEAR,
+    last_year: int = LAST_YEAR,
+    datastores: DataStores = DataStores(None, None),
+) -> pd.DataFrame:
+    """Return the stored points that differ from the points scored now."""
+    with open_database(datastores.database) as database:
+        return compare_points(database, first_year, last_year)
+
+
+def parse_arguments() -> ArgumentParser:
+    """Parse arguments."""
+    parser = ArgumentParser(
+        description="Check the stored points against the points scored now"
+    )
+    parser.add_argument(
+        "-y",
+        "--years",
+        nargs=2,
+        type=int,
+        default=[FIRST_YEAR, LAST_YEAR],
+        help="first and last years to check",
+    )
+    add_database_option(parser)
+    return parser
+
+
+def main() -> None:
+    """Command line argument processing."""
+    args = parse_arguments().parse_args()
+    first_year, last_year = args.years
+    differences = verify_points(
+        first_year, last_year, datastores=DataStores(None, args.database)
+    )
+    if differences.empty:
+        print(f"The stored points from {first_year} to {last_year} are correct.")
+        return
+    print(differences.to_string())
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Maximum totals and elimination from first place during a season."""
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from deepwellcup.core.database import DataSource
+from deepwellcup.utils.round_data import RoundData
+from deepwellcup.utils.utils import PlayedRound, RoundInfo, YearInfo
+
+from .points import RoundPoints
+from .points_systems import points_system, series_points_range
+from .simulation import (
+    NO_PICK,
+    NO_TEAM,
+    SLOTS,
+    ChampionsModel,
+    PlayoffSimulation,
+    SimulationModel,
+    finals_points,
+)
+
+
+@dataclass
+class Elimination:
+    """Maximum totals and elimination of every individual in a season.
+
+    An individual is eliminated when they cannot finish first, or tie for
+    first, on the points of selections. Other points are not included.
+    """
+
+    round_data: RoundData
+    previous: pd.Series | None = None
+
+    @cached_property
+    def simulation(self) -> PlayoffSimulation:
+        """Return the simulation holding the model of the rest of the round."""
+        return PlayoffSimulation(self.round_data, previous=self.previous)
+
+    @property
+    def individuals(self) -> pd.Index:
+        """Return the individuals in the season."""
+        return self.simulation.individuals
+
+    @property
+    def model(self) -> SimulationModel:
+        """Return the model of the open series and the Champions round."""
+        return self.simulation.model
+
+    @cached_property
+    def finals(self) -> np.ndarray:
+        """Return each East finalist, West finalist and winner that can happen."""
+        return _possible_finals(self.model.champions, self.model.alive)
+
+    @cached_property
+    def _finals_points(self) -> np.ndarray:
+        """Return the Champions points of every individual in each final."""
+        if self.model.champions is None:
+            return np.zeros((len(self.finals), len(self.individuals)), dtype=np.int64)
+        return finals_points(
+            self.model.champions, self.finals[:, :2], self.finals[:, 2]
+        ).astype(np.int64)
+
+    @cached_property
+    def _allowed_rows(self) -> list[list[np.ndarray]]:
+        """Return the possible points rows of every open series in each final."""
+        final_series = (
+            self.model.champions.final if self.model.champions is not None else -1
+        )
+        allowed = []
+        for east, west, winner in self.finals:
+            rows = []
+            for index, series in enumerate(self.model.series):
+                possible = (
+                    series.winners == winner
+                    if index == final_series
+                    else ~np.isin(series.losers, [east, west])
+                )
+                rows.append(np.unique(series.rows[possible]))
+            allowed.append(rows)
+        return allowed
+
+    @cached_property
+    def _open_bonus(self) -> np.ndarray:
+        """Return the open player and overtime points each individual can earn."""
+        round_info = self.simulation.scenarios.round_info
+        system = points_system(round_info.year)
+        bonus = pd.Series(0, index=self.individuals)
+        if "Player" in system:
+            selections = self.round_data.selections.series
+            is_open = selections.index.droplevel("Individual").isin(
+                self.simulation.scenarios.open_series.index
+            )
+            players = selections.loc[is_open, "Player"].fillna("") != ""
+            bonus = bonus.add(
+                players.groupby(level="Individual").sum() * int(system["Player"]),
+                fill_value=0,
+            )
+        if "Overtime" in system and self.round_data.results.overtime == "":
+            picked = self.round_data.selections.overtime.fillna("") != ""
+            bonus = bonus.add(
+                picked.astype(int) * int(system["Overtime"]), fill_value=0
+            )
+        return bonus.reindex(self.individuals, fill_value=0).to_numpy(dtype=np.int64)
+
+    @cached_property
+    def later_rounds(self) -> tuple[int, int]:
+        """Return the fewest and most points of the later played rounds."""
+        round_info = self.simulation.scenarios.round_info
+        return later_rounds_range(round_info)
+
+    @cached_property
+    def summary(self) -> pd.DataFrame:
+        """Return the current and maximum total and elimination of everyone."""
+        current = self.model.current
+        fewest, most = self.later_rounds
+        tables = [series.points for series in self.model.series]
+        best = np.array(
+            [
+                self._finals_points[final]
+                + sum(
+                    (table[rows].max(axis=0) for table, rows in zip(tables, allowed)),
+                    np.zeros_like(current),
+                )
+                for final, allowed in enumerate(self._allowed_rows)
+                if all(len(rows) for rows in allowed)
+            ]
+        )
+        maximum = current + self._open_bonus + most + best.max(axis=0)
+        eliminated = [
+            not self._can_finish_first(individual, most - fewest)
+            for individual in range(len(current))
+        ]
+        summary = pd.DataFrame(
+            {"Current": current, "Maximum": maximum, "Eliminated": eliminated},
+            index=self.individuals.rename("Individual"),
+        )
+        return summary.sort_values(
+            ["Eliminated", "Maximum"], ascending=[True, False], kind="stable"
+        )
+
+    def _can_finish_first(self, individual: int, later: int) -> bool:
+        """Return whether an outcome lets the individual finish first."""
+        current = self.model.current
+        # the undecided player, overtime and later points all go to the individual
+        start = current[individual] - current + self._open_bonus[individual] + later
+        tables = [series.points for series in self.model.series]
+        for final, allowed in enumerate(self._allowed_rows):
+            if not all(len(rows) for rows in allowed):
+                continue
+            champions = self._finals_points[final]
+            margins = start + champions[individual] - champions
+            differences = [
+                table[rows, individual][:, None] - table[rows]
+                for table, rows in zip(tables, allowed)
+            ]
+            if _search(margins, differences, _suffix_bounds(differences)):
+                return True
+        return False
+
+
+def _possible_finals(champions: ChampionsModel | None, alive: np.ndarray) -> np.ndarray:
+    """Return the East finalist, West finalist and winner of every final.
+
+    Finalists are drawn from the teams still alive in each slot, and a slot
+    without any is filled with NO_TEAM.
+    """
+    if champions is None:
+        return np.full((1, len(SLOTS) + 1), NO_TEAM)
+    candidates = []
+    for slot, fixed in enumerate(champions.finalists):
+        teams = (
+            [int(fixed)]
+            if fixed != NO_PICK
+            else np.flatnonzero(alive & (champions.slots == slot)).tolist()
+        )
+        candidates.append(teams or [NO_TEAM])
+    finals = []
+    for east, west in product(*candidates):
+        winners = (
+            [champions.winner]
+            if champions.winner != NO_PICK
+            else [team for team in (east, west) if team != NO_TEAM] or [NO_TEAM]
+        )
+        finals += [(east, west, winner) for winner in winners]
+    return np.array(finals).reshape(-1, len(SLOTS) + 1)
+
+
+def _suffix_bounds(differences: list[np.ndarray]) -> np.ndarray:
+    """Return the most each margin can grow from each series onwards."""
+    best = np.array([difference.max(axis=0) for difference in differences])
+    bounds = np.zeros(
+        (len(differences) + 1, differences[0].shape[1] if differences else 0)
+    )
+    if differences:
+        bounds[:-1] = best[::-1].cumsum(axis=0)[::-1]
+    return bounds
+
+
+def _search(
+    margins: np.ndarray,
+    differences: list[np.ndarray],
+    bounds: np.ndarray,
+    depth: int = 0,
+) -> bool:
+    """Return whether the remaining series can leave every margin at least 0.
+
+    The margins are the points of the individual minus those of each rival.
+    """
+    if depth == len(differences):
+        return bool((margins >= 0).all())
+    # the outcomes of the open series were limited to those possible with the
+    # final being searched, and a branch is dropped once some rival stays
+    # ahead even when every remaining series goes the individual's way
+    if (margins + bounds[depth] < 0).any():
+        return False
+    rows = differences[depth]
+    # rows that leave the closest rival furthest behind are tried first
+    order = np.argsort(-(margins + rows).min(axis=1), kind="stable")
+    return any(
+        _search(margins + rows[row], differences, bounds, depth + 1) for row in order
+    )
+
+
+def later_rounds_range(round_info: RoundInfo) -> tuple[int, int]:
+    """Return the fewest and most selection points after a played round.
+
+    Each later round adds its series, the player of each series and the
+    overtime selection when the points system has them. Other points are not
+    included.
+    """
+    system = points_system(round_info.year)
+    played_rounds = YearInfo(round_info.year).played_rounds
+    later = played_rounds.index(round_info.played_round) + 1
+    fewest = most = 0
+    for played_round in played_rounds[later:]:
+        low, high = series_points_range(round_info.year, played_round)
+        high += int(system.get("Player", 0))
+        number = RoundInfo(played_round, round_info.year).number_of_series
+        fewest += number * low
+        most += number * high + int(system.get("Overtime", 0))
+    return fewest, most
+
+
+def previous_points(
+    year: int, played_round: PlayedRound, database: DataSource
+) -> pd.Series:
+    """Return the total points of every individual before a played round."""
+    played_rounds = YearInfo(year).played_rounds
+    points = pd.Series(dtype="int64", name="Points")
+    for earlier in played_rounds[: played_rounds.index(played_round)]:
+        total = RoundPoints(RoundData(year, earlier, database)).total
+        points = points.add(total.fillna(0).astype(int), fill_value=0)
+    return points.astype(int).rename("Points")
@@ -0,0 +1,111 @@
+"""Compiled points formulas.
+
+Formulas are strings of arithmetic on the correct (C) and predicted (P)
+number of games, such as "15-2*abs(P-C)". They are parsed into a tree of
+numpy operations, so any name, call or syntax outside of that arithmetic is
+rejected rather than evaluated.
+"""
+import ast
+import operator
+import typing
+from typing import Callable
+
+import numpy as np
+
+from deepwellcup.utils.utils import PlayedRound
+
+RoundKind = typing.Literal["Q", "played"]
+Formula = Callable[..., typing.Any]
+
+VARIABLES = ("C", "P")
+
+_BINARY_OPERATORS: dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS: dict[type, Callable] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+_FUNCTIONS: dict[str, Callable] = {
+    "abs": np.abs,
+}
+
+_registry: dict[tuple[int, RoundKind, str], Formula] = {}
+
+
+def round_kind(played_round: PlayedRound) -> RoundKind:
+    """Return the kind of round a played round scores with."""
+    return "Q" if played_round == "Q" else "played"
+
+
+def formula_handles(kind: RoundKind) -> tuple[str, str]:
+    """Return the system keys of the correct and incorrect team formulas."""
+    if kind == "Q":
+        return "f_correct_round_Q", "f_incorrect_round_Q"
+    return "f_correct", "f_incorrect"
+
+
+def registered_formula(year: int, kind: RoundKind, formula: str) -> Formula:
+    """Return a formula from the registry, compiling it if it is missing."""
+    key = (year, kind, formula)
+    if key not in _registry:
+        _registry[key] = compile_formula(formula)
+    return _registry[key]
+
+
+class FormulaError(Exception):
+    """Exception for a formula that cannot be compiled."""
+
+
+def compile_formula(formula: str) -> Formula:
+    """Return a formula of C and P compiled to a vectorized numpy function."""
+    try:
+        tree = ast.parse(formula, mode="eval")
+    except SyntaxError as error:
+        raise FormulaError(f"The formula, {formula}, is not valid.") from error
+    evaluate = _compile_node(tree.body, formula)
+
+    def compiled(correct, predicted):
+        return evaluate({"C": correct, "P": predicted})
+
+    return compiled
+
+
+def _compile_node(
+    node: ast.expr, formula: str
+) -> Callable[[dict[str, typing.Any]], typing.Any]:
+    """Return a function evaluating a node with the values of the variables."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        return lambda variables: value
+    if isinstance(node, ast.Name) and node.id in VARIABLES:
+        name = node.id
+        return lambda variables: variables[name]
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        binary = _BINARY_OPERATORS[type(node.op)]
+        left = _compile_node(node.left, formula)
+        right = _compile_node(node.right, formula)
+        return lambda variables: binary(left(variables), right(variables))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        unary = _UNARY_OPERATORS[type(node.op)]
+        operand = _compile_node(node.operand, formula)
+        return lambda variables: unary(operand(variables))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        function = _FUNCTIONS[node.func.id]
+        argument = _compile_node(node.args[0], formula)
+        return lambda variables: function(argument(variables))
+    raise FormulaError(
+        f"The formula, {formula}, contains an unsupported expression: "
+        f"{ast.unparse(node)}"
+    )
@@ -0,0 +1,150 @@
+"""Points of every individual across many seasons."""
+import pandas as pd
+
+from deepwellcup.core.database import (
+    POINTS_COLUMNS,
+    DataBase,
+    DataSource,
+    SeasonData,
+)
+from deepwellcup.utils.round_data import RoundData
+from deepwellcup.utils.utils import RoundInfo, SelectionRound, YearInfo
+
+from .points import RoundPoints, champions_selection_points, round_selection_points
+from .points_systems import FIRST_YEAR, LAST_YEAR, points_system
+
+COLUMNS = POINTS_COLUMNS
+
+
+def season_points(
+    database: DataBase, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR
+) -> pd.DataFrame:
+    """Return the points of every individual in every round of a range of years.
+
+    The seasons are read together with DataBase.load_seasons and scored with
+    the points system of each year. The table has a row for each year, round,
+    individual and component, where the components are the "Selection" points
+    and the "Other" points. Rounds without selections or results are skipped.
+    """
+    seasons = database.load_seasons(first_year, last_year)
+    tables = [
+        _points_table(year, selection_round, component, points)
+        for year, season in seasons.items()
+        for selection_round in YearInfo(year).selection_rounds
+        for component, points in _round_points(season, selection_round).items()
+        if not points.empty
+    ]
+    if not tables:
+        return pd.DataFrame(columns=COLUMNS).astype({"Points": "Int64"})
+    return pd.concat(tables, ignore_index=True).astype({"Points": "Int64"})
+
+
+def round_points(
+    database: DataSource, year: int, selection_round: SelectionRound
+) -> pd.DataFrame:
+    """Return the points of every individual in a selection round.
+
+    The points are scored with RoundPoints, and the rows match those of
+    season_points for the round.
+    """
+    with database as db:
+        if selection_round == "Champions":
+            played = not db.get_champions_selections(
+                year
+            ).empty and _stanley_cup_decided(db.get_champions_results(year))
+        else:
+            played = not db.get_round_selections(
+                RoundInfo(played_round=selection_round, year=year)
+            ).empty
+    if not played:
+        return pd.DataFrame(columns=COLUMNS).astype({"Points": "Int64"})
+    points = RoundPoints(RoundData(year, selection_round, database))
+    tables = [
+        _points_table(year, selection_round, component, component_points)
+        for component, component_points in (
+            ("Selection", points.selection),
+            ("Other", points.other),
+        )
+        if not component_points.empty
+    ]
+    return pd.concat(tables, ignore_index=True).astype({"Points": "Int64"})
+
+
+def compare_points(
+    database: DataBase, first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR
+) -> pd.DataFrame:
+    """Return the stored points that differ from the points scored now.
+
+    The stored and scored tables are aligned on the year, round, individual
+    and component, and missing points count as 0.
+    """
+    keys = COLUMNS[:-1]
+    with database as db:
+        stored = db.get_points(first_year, last_year)
+    scored = season_points(database, first_year, last_year)
+    compared = (
+        stored.astype({"Round": str})
+        .merge(
+            scored.astype({"Round": str}),
+            on=keys,
+            how="outer",
+            suffixes=(" Stored", " Scored"),
+        )
+        .rename(columns={"Points Stored": "Stored", "Points Scored": "Scored"})
+        .fillna({"Stored": 0, "Scored": 0})
+    )
+    return compared[compared["Stored"] != compared["Scored"]].reset_index(drop=True)
+
+
+def _round_points(
+    season: SeasonData, selection_round: SelectionRound
+) -> dict[str, pd.Series]:
+    """Return the points of each component in a selection round."""
+    year = season.year
+    system = points_system(year)
+    if selection_round == "Champions":
+        selections = season.get_champions_selections(year)
+        results = season.get_champions_results(year)
+        if selections.empty or not _stanley_cup_decided(results):
+            return {}
+        return {"Selection": champions_selection_points(selections, results, system)}
+    round_info = RoundInfo(played_round=selection_round, year=year)
+    selections = season.get_round_selections(round_info)
+    if selections.empty:
+        return {}
+    selection = round_selection_points(
+        selections,
+        season.get_round_results(round_info),
+        season.get_overtime_selections(round_info),
+        season.get_overtime_results(round_info),
+        system,
+        round_info,
+    )
+    return {"Selection": selection, "Other": season.get_other_points(round_info)}
+
+
+def _stanley_cup_decided(results: pd.Series) -> bool:
+    """Return whether the Stanley Cup winner is in the champions results.
+
+    Until then the runner-up is unknown, so the Champions round is not scored.
+    """
+    if results.empty:
+        return False
+    winner = results["Stanley Cup"]
+    return bool(pd.notna(winner) and winner != "")
+
+
+def _points_table(
+    year: int, selection_round: SelectionRound, component: str, points: pd.Series
+) -> pd.DataFrame:
+    """Return the points of a component in the long format."""
+    return pd.DataFrame(
+        {
+            "Year": year,
+            "Round": selection_round,
+            "Individual": points.index.to_numpy(),
+            "Component": component,
+            "Points": points.to_numpy(),
+        },
+        columns=COLUMNS,
+    )
@@ -1,11 +1,10 @@
 """Calculate points."""
 from dataclasses import dataclass, field
-from functools import partial
+from functools import cached_property, partial
 from typing import Callable
 
+import numpy as np
 import pandas as pd
-from sympy import symbols
-from sympy.utilities.lambdify import lambdify
 
 from deepwellcup.utils.round_data import (
     ChampionsResults,
@@ -14,14 +13,9 @@ from deepwellcup.utils.round_data import (
     PlayedSelections,
     RoundData,
 )
-from deepwellcup.utils.utils import (
-    PlayedRound,
-    RoundInfo,
-    SelectionRound,
-    YearInfo,
-)
+from deepwellcup.utils.utils import RoundInfo, SelectionRound
 
-from .points_systems import points_system
+from .points_systems import duration_points, fixed_pick_points, points_system
 
 SimpleSystem = dict[str, int]
 ComplexSystem = dict[str, int | str]
@@ -29,11 +23,7 @@ EitherSystem = SimpleSystem | ComplexSystem
 Results = PlayedResults | ChampionsResults
 Selections = PlayedSelections | ChampionsSelections
 ChampionsMethod = Callable[[pd.DataFrame, pd.Series, EitherSystem], pd.Series]
-PlayedMethod = Callable[[PlayedSelections, PlayedResults, EitherSystem], pd.Series]
 IndividualChampionsMethod = Callable[[pd.Series, pd.Series, EitherSystem], int]
-IndividualPlayedMethod = Callable[
-    [pd.DataFrame, pd.Series, PlayedResults, EitherSystem, RoundInfo], int
-]
 
 
 class InputError(Exception):
@@ -52,32 +42,36 @@ class RoundPoints:
         self.year = self.round_data.year
         self.selection_round = self.round_data.selection_round
 
-    @property
+    def invalidate(self) -> None:
+        """Discard the computed points so they are computed again when read."""
+        self.round_data.reload()
+        for name in ("selection", "other", "total"):
+            self.__dict__.pop(name, None)
+
+    @cached_property
     def selection(self) -> pd.Series:
         """Return points for selections."""
         system = points_system(self.year)
         if self.selection_round == "Champions":
-            calculate_champ_points = _get_champions_method(system)
-            return calculate_champ_points(
+            return champions_selection_points(
                 self.round_data.selections.champions,
                 self.round_data.results.champions,
                 system,
             )
-        calculate_round_points = _get_played_method(system)
-        return calculate_round_points(
+        return played_points(
             self.round_data.selections,
             self.round_data.results,
             system,
         )
 
-    @property
+    @cached_property
     def other(self) -> pd.Series:
         """Return the other points."""
         if self.selection_round == "Champions":
             return pd.Series()
         return self.round_data.other_points.points
 
-    @property
+    @cached_property
     def total(self) -> pd.Series:
         """Return the total points of selections and other."""
         if self.other.empty:
@@ -89,211 +83,153 @@ class RoundPoints:
         )
 
 
-def _get_played_method(system: EitherSystem) -> PlayedMethod:
-    points_for_individual = (
-        _points_for_individual_played_2
-        if "f_correct" in system
-        else _points_for_individual_played_1
-    )
-    return partial(played_points, points_for_individual=points_for_individual)
-
-
 def played_points(
     selections: PlayedSelections,
     results: PlayedResults,
-    system: SimpleSystem,
-    points_for_individual: IndividualPlayedMethod,
+    system: EitherSystem,
 ) -> pd.Series:
-    """Selections points in the played round using a paradigm."""
+    """Selections points of every individual in the played round."""
     round_info = RoundInfo(
         played_round=selections.selection_round, year=selections.year
     )
-    points = {
-        individual: points_for_individual(
-            selections.series.loc[individual],
-            (
-                selections.overtime.loc[individual]
-                if individual in selections.overtime
-                else ""
-            ),
-            results,
-            system,
-            round_info,
-        )
-        for individual in selections.series.index.get_level_values("Individual")
-    }
-    name = f"Round {round_info.played_round}"
-    return _create_points_series(points, name)
+    return round_selection_points(
+        selections.series,
+        results.series,
+        selections.overtime,
+        results.overtime,
+        system,
+        round_info,
+    )
 
 
-def _points_for_individual_played_1(
+def round_selection_points(  # pylint: disable=R0913
     series_selections: pd.DataFrame,
-    overtime_selection: str,  # pylint: disable=W0613
-    results: PlayedResults,
-    system: SimpleSystem,
+    series_results: pd.DataFrame,
+    overtime_selections: pd.Series,
+    overtime_result: str,
+    system: EitherSystem,
     round_info: RoundInfo,
-) -> int:
-    """Return the points for an individual in playoff rounds."""
-    return _team_and_duration_points(
-        series_selections, results.series, system, round_info
-    ) + _game_7_points(
-        series_selections["Duration"],
-        results.series["Duration"],
-        system,
+) -> pd.Series:
+    """Selections points of every individual from the frames of a played round."""
+    pick_points = series_points(series_selections, series_results, system, round_info)
+    points = pick_points.groupby(level="Individual", sort=False).sum()
+    if "Overtime" in system:
+        points += overtime_points(
+            overtime_selections.reindex(points.index, fill_value=""),
+            overtime_result,
+            system,
+        )
+    name = f"Round {round_info.played_round}"
+    return _create_points_series(
+        {str(individual): int(value) for individual, value in points.items()}, name
     )
 
 
-def _team_and_duration_points(
+def series_points(
     selections: pd.DataFrame,
     results: pd.DataFrame,
-    system: SimpleSystem,
+    system: EitherSystem,
     round_info: RoundInfo,
-) -> int:
-    """Return the points for selecting teams and durations."""
-    num_correct_teams = sum(_is_correct_team(selections["Team"], results["Team"]))
-    num_correct_duration = sum(
-        _is_correct_duration(selections["Duration"], results["Duration"])
-    )
-    if round_info.played_round in YearInfo(round_info.year).conference_rounds:
-        team_key = (
-            "correct_team_rounds_123"
-            if "correct_team_rounds_123" in system
-            else "correct_team"
-        )
-        duration_key = (
-            "correct_length_rounds_123"
-            if "correct_length_rounds_123" in system
-            else "correct_length"
-        )
+) -> pd.Series:
+    """Return the points of each series selection.
+
+    The selections are indexed by individual, conference and series, and are
+    aligned with the results of the conference and series. A selection of an
+    unfinished series earns no points.
+    """
+    aligned = selections.join(results, on=["Conference", "Series"], rsuffix=" Result")
+    finished = aligned["Team Result"].notna() & aligned.index.droplevel(
+        "Individual"
+    ).isin(results.index)
+    if "f_correct" in system:
+        points = _gradient_team_points(aligned, finished, round_info)
+        points += _player_points(aligned, system)
     else:
-        team_key = (
-            "correct_team_rounds_4"
-            if "correct_team_rounds_4" in system
-            else "correct_team"
-        )
-        duration_key = (
-            "correct_length_rounds_4"
-            if "correct_length_rounds_4" in system
-            else "correct_length"
-        )
-    return (
-        num_correct_teams * system[team_key]
-        + num_correct_duration * system[duration_key]
-    )
+        points = _fixed_team_and_duration_points(aligned, round_info)
+    return points.where(finished, 0)
 
 
-def _game_7_points(
-    picked_durations: pd.Series, correct_durations: pd.Series, system: SimpleSystem
-) -> int:
-    """Return the points for correct game 7 predictions."""
-    if "correct_7game_series" not in system:
-        return 0
-    num_correct_7games = _number_of_correct_game_7s(picked_durations, correct_durations)
-    return num_correct_7games * system["correct_7game_series"]
+def _fixed_team_and_duration_points(
+    aligned: pd.DataFrame, round_info: RoundInfo
+) -> pd.Series:
+    """Return the fixed points for each correct team, length and game 7."""
+    team_points, length_points, game_7_points = fixed_pick_points(
+        round_info.year, round_info.played_round
+    )
+    correct_team = (aligned["Team"] == aligned["Team Result"]).fillna(False)
+    correct_duration = (aligned["Duration"] == aligned["Duration Result"]).fillna(False)
+    correct_game_7 = correct_duration & (aligned["Duration Result"] == 7).fillna(False)
+    return (
+        correct_team.astype(int) * team_points
+        + correct_duration.astype(int) * length_points
+        + correct_game_7.astype(int) * game_7_points
+    )
 
 
-def _points_for_individual_played_2(
-    selections: pd.DataFrame,
-    overtime_selection: str,
-    results: PlayedResults,
-    system: ComplexSystem,
+def _gradient_team_points(
+    aligned: pd.DataFrame,
+    finished: pd.Series,
     round_info: RoundInfo,
-) -> int:
-    """Return the points for an individual in playoff rounds."""
-    correct_team_points, incorrect_team_points = _gradient_team_points(
-        selections, results.series, system, round_info.played_round
+) -> pd.Series:
+    """Return the points of each team and duration from the lookup tables."""
+    tables = duration_points(round_info.year, round_info.played_round)
+    correct = (aligned["Team"] == aligned["Team Result"]).fillna(False).to_numpy()
+    lengths = _games(aligned["Duration Result"].where(finished))
+    picked = _games(aligned["Duration"])
+    points = np.where(
+        correct,
+        tables.correct[lengths, picked],
+        tables.incorrect[lengths, picked],
     )
-    player_points = _player_points(selections, results.series, system)
-    overtime_points = _overtime_points(overtime_selection, results.overtime, system)
-    return correct_team_points + incorrect_team_points + player_points + overtime_points
+    return pd.Series(points, index=aligned.index)
 
 
-def _gradient_team_points(
-    selections: pd.DataFrame,
-    results: pd.DataFrame,
-    system: ComplexSystem,
-    played_round: PlayedRound,
-) -> tuple[int, int]:
-    f_correct, f_incorrect = _get_correct_gradient_functions(played_round, system)
-
-    finished_series = results.index
-    if len(finished_series) < 8:
-        series = selections.index
-        unfinished_series = list(set(series) - set(finished_series))
-        filtered_selections = selections.drop(unfinished_series)
-    else:
-        filtered_selections = selections
-    comparison = filtered_selections.compare(
-        results,
-        keep_shape=True,
-        keep_equal=True,
-        result_names=("selections", "results"),
-    )
-    correct = comparison.query(
-        "@comparison.Team.selections == @comparison.Team.results"
-    )
-    incorrect = comparison.query(
-        "@comparison.Team.selections != @comparison.Team.results"
-    )
-    correct_points = f_correct(
-        correct[("Duration", "selections")].to_numpy(),
-        correct[("Duration", "results")].to_numpy(),
-    ).sum()
-    incorrect_points = f_incorrect(
-        incorrect[("Duration", "selections")].to_numpy(),
-        incorrect[("Duration", "results")].to_numpy(),
-    ).sum()
-    return correct_points, incorrect_points
-
-
-def _get_correct_gradient_functions(
-    played_round: PlayedRound, system: ComplexSystem
-) -> tuple[Callable, Callable]:
-    c, p = symbols("C P")
-    if played_round == "Q":
-        correct_handle = "f_correct_round_Q"
-        incorrect_handle = "f_incorrect_round_Q"
-    else:
-        correct_handle = "f_correct"
-        incorrect_handle = "f_incorrect"
-    f_correct = lambdify((c, p), system[correct_handle], "numpy")
-    f_incorrect = lambdify((c, p), system[incorrect_handle], "numpy")
-    return f_correct, f_incorrect
+def _games(durations: pd.Series) -> np.ndarray:
+    """Return the number of games in each series, with 0 when unknown."""
+    return durations.astype("Int64").to_numpy(dtype=np.int64, na_value=0)
 
 
-def _player_points(
-    selections: pd.DataFrame,
-    results: pd.DataFrame,
-    system: ComplexSystem,
-) -> int:
+def _player_points(aligned: pd.DataFrame, system: EitherSystem) -> pd.Series:
+    """Return the points of each correct player selection."""
     if "Player" not in system:
-        return 0
-    num_correct_players = (selections["Player"].fillna("") == results["Player"]).sum()
-    return num_correct_players * int(system["Player"])
+        return pd.Series(0, index=aligned.index)
+    correct = aligned["Player"].fillna("") == aligned["Player Result"]
+    return correct.astype(int) * int(system["Player"])
     # no points are awarded for ties in points by Players
 
 
-def _overtime_points(
-    selection: str,
+def overtime_points(
+    selections: pd.Series,
     result: str,
-    system: ComplexSystem,
-) -> int:
+    system: EitherSystem,
+) -> pd.Series:
+    """Return the overtime points of each individual.
+
+    Selections one game off the result earn partial points, where "More than 3"
+    is one game off of 3.
+    """
     if "Overtime" not in system or result == "":
-        return 0
-    if selection == result:
-        return int(system["Overtime"])
-    ot_numbers_off_by_one = (
-        selection != "More than 3"
-        and result != "More than three"
-        and abs(int(result) - int(selection)) == 1
-    )
-    if (
-        (selection == "More than 3" and result == "3")
-        or (selection == "3" and result == "More than 3")
-        or ot_numbers_off_by_one
-    ):
-        return int(system["Overtime (1 game off)"])
-    return 0
+        return pd.Series(0, index=selections.index)
+    selections = selections.astype(str)
+    correct = selections == result
+    picked_games = pd.to_numeric(selections, errors="coerce")
+    result_games = pd.to_numeric(pd.Series([result]), errors="coerce")[0]
+    one_game_off = ((picked_games - result_games).abs() == 1).fillna(False)
+    if result == "3":
+        one_game_off |= selections == "More than 3"
+    if result == "More than 3":
+        one_game_off |= selections == "3"
+    return correct.astype(int) * int(system["Overtime"]) + (
+        one_game_off & ~correct
+    ).astype(int) * int(system["Overtime (1 game off)"])
+
+
+def champions_selection_points(
+    selections: pd.DataFrame, results: pd.Series, system: EitherSystem
+) -> pd.Series:
+    """Selections points of every individual in the Champions round."""
+    calculate_champ_points = _get_champions_method(system)
+    return calculate_champ_points(selections, results, system)
 
 
 def _get_champions_method(system: EitherSystem) -> ChampionsMethod:
@@ -359,16 +295,6 @@ def _points_for_individual_champions_2(
     return None if total_points == 0 else total_points
 
 
-def _number_of_correct_game_7s(picks: pd.Series, correct: pd.Series) -> int:
-    return sum(
-        correct_duration and game7s
-        for correct_duration, game7s in zip(
-            _is_correct_duration(picks, correct),
-            _is_duration_7_games(correct),
-        )
-    )
-
-
 def _create_points_series(
     points: dict[str, int] | dict[str, int | None], name: str
 ) -> pd.Series:
@@ -379,24 +305,6 @@ def _create_points_series(
     )
 
 
-def _is_correct_team(picks: pd.Series, correct: pd.Series) -> list[bool]:
-    return [
-        pick == correct if pick is not None and correct is not None else False
-        for pick, correct in zip(picks, correct)
-    ]
-
-
-def _is_correct_duration(picks: pd.Series, correct: pd.Series) -> list[bool]:
-    return [
-        pick == correct if not pd.isna(pick) and not pd.isna(correct) else False
-        for pick, correct in zip(picks, correct)
-    ]
-
-
-def _is_duration_7_games(durations: pd.Series) -> list[bool]:
-    return [pick == 7 for pick in durations]
-
-
 def _find_runnerup(table: pd.Series) -> str:
     return str(
         [team for team in table[["East", "West"]] if team != table["Stanley Cup"]][0]
@@ -1,4 +1,31 @@
 """Point scoring systems."""
+import typing
+from functools import cache
+
+import numpy as np
+
+from deepwellcup.utils.utils import PlayedRound, RoundInfo, YearInfo
+
+from .formulas import (
+    Formula,
+    RoundKind,
+    formula_handles,
+    registered_formula,
+    round_kind,
+)
+
+FIRST_YEAR = 2006
+LAST_YEAR = 2025
+
+
+class DurationPoints(typing.NamedTuple):
+    """Points for the team selected, indexed by the correct and predicted games.
+
+    Entries outside the possible series durations are zero.
+    """
+
+    correct: np.ndarray
+    incorrect: np.ndarray
 
 
 def points_system(year: int):
@@ -16,6 +43,97 @@ def points_system(year: int):
     raise NotImplementedError(f"Scoring system for {year} is not implemented.")
 
 
+def fixed_pick_points(year: int, played_round: PlayedRound) -> tuple[int, int, int]:
+    """Return the points for a correct team, length and 7 game series.
+
+    Only the systems that award fixed points for each correct pick are
+    supported.
+    """
+    system = points_system(year)
+    if "f_correct" in system:
+        raise NotImplementedError(
+            f"The {year} scoring system does not award fixed points for picks."
+        )
+    rounds = (
+        "rounds_123" if played_round in YearInfo(year).conference_rounds else "rounds_4"
+    )
+    team = system.get(f"correct_team_{rounds}", system.get("correct_team"))
+    length = system.get(f"correct_length_{rounds}", system.get("correct_length"))
+    game_7 = system.get("correct_7game_series", 0)
+    return int(team), int(length), int(game_7)  # type: ignore[arg-type]
+
+
+def gradient_functions(year: int, played_round: PlayedRound) -> tuple[Formula, Formula]:
+    """Return the compiled correct and incorrect team formulas of a round.
+
+    Each formula is a vectorized function of the correct (C) and predicted (P)
+    number of games.
+    """
+    kind = round_kind(played_round)
+    system = points_system(year)
+    correct_handle, incorrect_handle = formula_handles(kind)
+    return (
+        registered_formula(year, kind, str(system[correct_handle])),
+        registered_formula(year, kind, str(system[incorrect_handle])),
+    )
+
+
+@cache
+def duration_points(year: int, played_round: PlayedRound) -> DurationPoints:
+    """Return the lookup tables of the correct and incorrect team formulas."""
+    durations = np.array(RoundInfo(played_round, year).series_duration_options)
+    correct_games, predicted_games = np.meshgrid(durations, durations, indexing="ij")
+    tables = []
+    for formula in gradient_functions(year, played_round):
+        table = np.zeros((durations.max() + 1, durations.max() + 1), dtype=np.int64)
+        table[correct_games, predicted_games] = formula(correct_games, predicted_games)
+        table.flags.writeable = False
+        tables.append(table)
+    return DurationPoints(*tables)
+
+
+def series_points_range(year: int, played_round: PlayedRound) -> tuple[int, int]:
+    """Return the fewest and most points of the team and games of a series.
+
+    Player points are not included.
+    """
+    system = points_system(year)
+    if "f_correct" not in system:
+        team, length, game_7 = fixed_pick_points(year, played_round)
+        options = RoundInfo(played_round, year).series_duration_options
+        return 0, team + length + (game_7 if 7 in options else 0)
+    durations = np.array(RoundInfo(played_round, year).series_duration_options)
+    correct_games, predicted_games = np.meshgrid(durations, durations, indexing="ij")
+    points = np.concatenate(
+        [
+            table[correct_games, predicted_games]
+            for table in duration_points(year, played_round)
+        ]
+    )
+    return int(points.min()), int(points.max())
+
+
+def precompile(
+    first_year: int = FIRST_YEAR, last_year: int = LAST_YEAR
+) -> list[tuple[int, RoundKind, str]]:
+    """Compile the formulas of every points system and return their keys.
+
+    The duration lookup tables of each system are built as well.
+    """
+    keys = []
+    for year in range(first_year, last_year + 1):
+        system = points_system(year)
+        for played_round in YearInfo(year).played_rounds:
+            kind = round_kind(played_round)
+            if not all(handle in system for handle in formula_handles(kind)):
+                continue
+            duration_points(year, played_round)
+            keys += [
+                (year, kind, str(system[handle])) for handle in formula_handles(kind)
+            ]
+    return sorted(set(keys))
+
+
 def points_system_2006_2007() -> dict[str, int]:
     """Return system used in 2006 and 2007."""
     return {
@@ -0,0 +1,318 @@
+"""Standings in every remaining outcome of a played round."""
+import typing
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from deepwellcup.utils.round_data import RoundData
+from deepwellcup.utils.utils import RoundInfo, SeriesLength
+
+from .points import InputError, RoundPoints, series_points
+from .points_systems import points_system
+
+# number of points evaluated at once when the standings are summed
+CHUNK_SIZE = 2**18
+
+
+class Outcome(typing.NamedTuple):
+    """Winner and number of games of a series."""
+
+    team: str
+    duration: SeriesLength
+
+
+@dataclass(frozen=True)
+class SeriesTable:
+    """Points of every individual in each distinct outcome of a series.
+
+    Row i of points is earned by each outcome in outcomes[i], and weights[i] is
+    the number of those outcomes.
+    """
+
+    name: str
+    outcomes: tuple[tuple[Outcome, ...], ...]
+    points: np.ndarray
+    weights: np.ndarray
+
+
+@dataclass
+class RoundScenarios:
+    """Scenarios of the unfinished series in a played round.
+
+    Every outcome is equally likely, and the player and overtime points of
+    unfinished series are not counted.
+    """
+
+    round_data: RoundData
+    previous: pd.Series | None = None
+    round_info: RoundInfo = field(init=False)
+
+    def __post_init__(self):
+        if self.round_data.selection_round == "Champions":
+            raise InputError("Scenarios are only available for played rounds.")
+        self.round_info = RoundInfo(
+            played_round=self.round_data.selection_round, year=self.round_data.year
+        )
+
+    @cached_property
+    def _selections(self) -> pd.DataFrame:
+        return self.round_data.selections.series
+
+    @cached_property
+    def _results(self) -> pd.DataFrame:
+        return self.round_data.results.series
+
+    @cached_property
+    def current(self) -> pd.Series:
+        """Return the points of every individual before the open series end."""
+        points = RoundPoints(self.round_data).total.astype("Int64")
+        individuals = self._selections.index.get_level_values("Individual").unique()
+        index = points.index.union(individuals)
+        if self.previous is not None:
+            index = index.union(self.previous.index)
+            points = points.reindex(index, fill_value=0) + self.previous.reindex(
+                index, fill_value=0
+            )
+        return points.reindex(index, fill_value=0).fillna(0).astype(int)
+
+    @cached_property
+    def open_series(self) -> pd.DataFrame:
+        """Return the seeds of each series without a result."""
+        with self.round_data.database as db:
+            series = db.get_series(self.round_info)
+        finished = self._results["Team"].dropna().index.get_level_values("Series")
+        return (
+            series.reset_index()
+            .set_index(["Conference", "Name"])
+            .rename_axis(index=["Conference", "Series"])
+            .drop(columns="Series Number")
+            .loc[lambda table: ~table.index.get_level_values("Series").isin(finished)]
+        )
+
+    @property
+    def scenario_count(self) -> int:
+        """Return the number of combinations of outcomes of the open series."""
+        return int(np.prod([table.weights.sum() for table in self.tables]))
+
+    @cached_property
+    def tables(self) -> list[SeriesTable]:
+        """Return the points table of each open series."""
+        seeds = self.open_series.reset_index()[
+            ["Conference", "Series", "Higher Seed", "Lower Seed"]
+        ]
+        return [
+            self._series_table(conference, name, (higher_seed, lower_seed))
+            for conference, name, higher_seed, lower_seed in seeds.itertuples(
+                index=False, name=None
+            )
+        ]
+
+    def _series_table(
+        self, conference: str, name: str, teams: tuple[str, str]
+    ) -> SeriesTable:
+        """Return the points of each outcome of a series, merging equal ones."""
+        is_series = (self._selections.index.get_level_values("Series") == name) & (
+            self._selections.index.get_level_values("Conference") == conference
+        )
+        selections = self._selections[is_series]
+        outcomes = [
+            Outcome(team, duration)
+            for team, duration in product(
+                teams, self.round_info.series_duration_options
+            )
+        ]
+        distinct, inverse, weights = np.unique(
+            np.array(
+                [
+                    self._outcome_points(selections, conference, name, outcome)
+                    for outcome in outcomes
+                ]
+            ),
+            axis=0,
+            return_inverse=True,
+            return_counts=True,
+        )
+        grouped = tuple(
+            tuple(outcome for outcome, row in zip(outcomes, inverse) if row == index)
+            for index in range(len(distinct))
+        )
+        return SeriesTable(name, grouped, distinct, weights)
+
+    def _outcome_points(
+        self, selections: pd.DataFrame, conference: str, name: str, outcome: Outcome
+    ) -> np.ndarray:
+        """Return the points of every individual in an outcome of a series."""
+        result = pd.DataFrame(
+            {"Team": [outcome.team], "Duration": [outcome.duration], "Player": None},
+            index=pd.MultiIndex.from_tuples(
+                [(conference, name)], names=["Conference", "Series"]
+            ),
+        )
+        points = series_points(
+            selections, result, points_system(self.round_info.year), self.round_info
+        )
+        return (
+            points.groupby(level="Individual")
+            .sum()
+            .reindex(self.current.index, fill_value=0)
+            .to_numpy(dtype=np.int64)
+        )
+
+    def standings(self, outcomes: typing.Mapping[str, Outcome]) -> pd.Series:
+        """Return the points of every individual when the open series end so."""
+        points = self.current.to_numpy(dtype=np.int64).copy()
+        for table in self.tables:
+            if table.name not in outcomes:
+                raise InputError(f"The outcome of {table.name} is missing.")
+            row = next(
+                index
+                for index, group in enumerate(table.outcomes)
+                if Outcome(*outcomes[table.name]) in group
+            )
+            points += table.points[row]
+        return pd.Series(points, index=self.current.index, name="Points").sort_values(
+            ascending=False
+        )
+
+    @cached_property
+    def summary(self) -> pd.DataFrame:
+        """Return the range of points and the chance to win of every individual.
+
+        An individual has clinched when they lead alone in every scenario and
+        is eliminated when they cannot lead, or tie for the lead, in any.
+        Ties for the lead share the win equally.
+        """
+        current = self.current.to_numpy(dtype=np.int64)
+        minimum = current + sum(
+            (table.points.min(axis=0) for table in self.tables),
+            np.zeros_like(current),
+        )
+        maximum = current + sum(
+            (table.points.max(axis=0) for table in self.tables),
+            np.zeros_like(current),
+        )
+        contenders = maximum >= minimum.max()
+        wins, sole = _count_wins(
+            current[contenders],
+            [table.points[:, contenders] for table in self.tables],
+            [table.weights for table in self.tables],
+        )
+        count = self.scenario_count
+        summary = pd.DataFrame(
+            {
+                "Current": current,
+                "Minimum": minimum,
+                "Maximum": maximum,
+                "Win Probability": 0.0,
+                "Clinched": False,
+                "Eliminated": True,
+            },
+            index=self.current.index.rename("Individual"),
+        )
+        summary.loc[contenders, "Win Probability"] = wins / count
+        summary.loc[contenders, "Clinched"] = sole == count
+        summary.loc[contenders, "Eliminated"] = wins == 0
+        return summary.sort_values(
+            ["Win Probability", "Maximum"], ascending=False, kind="stable"
+        )
+
+
+def _count_wins(
+    current: np.ndarray, points: list[np.ndarray], weights: list[np.ndarray]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the weighted wins and sole leads of each individual.
+
+    The series are split in two halves whose combinations are enumerated and
+    merged separately. Each combination of the first half is then added to
+    every combination of the second.
+    """
+    half = len(points) // 2
+    first, first_weights = _combine(points[:half], weights[:half], current)
+    second, second_weights = _combine(
+        points[half:], weights[half:], np.zeros_like(current)
+    )
+    sole, decided = _decided_wins(first, first_weights, second, second_weights)
+    ties, summed_sole = _summed_wins(
+        first[~decided], first_weights[~decided], second, second_weights
+    )
+    sole += summed_sole
+    return ties + sole, sole
+
+
+def _decided_wins(
+    first: np.ndarray,
+    first_weights: np.ndarray,
+    second: np.ndarray,
+    second_weights: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the sole leads of the first half combinations that are decided.
+
+    A combination is decided when one individual leads alone even with the
+    fewest points of the second half, and the others with the most.
+    """
+    individuals = np.arange(first.shape[1])
+    lower = first + second.min(axis=0)
+    upper = first + second.max(axis=0)
+    leader = lower.argmax(axis=1)
+    others = np.where(individuals == leader[:, None], np.iinfo(np.int64).min, upper)
+    decided = lower[np.arange(len(first)), leader] > others.max(axis=1)
+    sole = np.zeros(first.shape[1])
+    np.add.at(sole, leader[decided], first_weights[decided] * second_weights.sum())
+    return sole, decided
+
+
+def _summed_wins(  # pylint: disable=R0914
+    first: np.ndarray,
+    first_weights: np.ndarray,
+    second: np.ndarray,
+    second_weights: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the weighted shares of ties and sole leads from summed standings."""
+    dtype = _points_dtype(
+        first.min(initial=0) + second.min(initial=0),
+        first.max(initial=0) + second.max(initial=0),
+    )
+    # individuals are along the first axis so the reductions are elementwise
+    first = first.T.astype(dtype)
+    second = second.T.astype(dtype)
+    labels = np.arange(len(first), dtype=np.int16)[:, None, None]
+    ties = np.zeros(len(first))
+    sole = np.zeros(len(first))
+    chunk = max(1, CHUNK_SIZE // second.size)
+    for start in range(0, first.shape[1], chunk):
+        block = slice(start, start + chunk)
+        totals = first[:, block, None] + second[:, None, :]
+        leading = totals == totals.max(axis=0)
+        leaders = leading.sum(axis=0, dtype=np.int32)
+        weight = np.outer(first_weights[block], second_weights)
+        alone = leaders == 1
+        leader = (leading.view(np.uint8) * labels).sum(axis=0, dtype=np.int32)
+        sole += np.bincount(leader[alone], weights=weight[alone], minlength=len(sole))
+        tied = ~alone
+        ties += leading[:, tied] @ (weight[tied] / leaders[tied])
+    return ties, sole
+
+
+def _points_dtype(lowest: int, highest: int) -> type:
+    """Return the smallest integer type that holds the points."""
+    limits = np.iinfo(np.int16)
+    return np.int16 if limits.min <= lowest and highest <= limits.max else np.int64
+
+
+def _combine(
+    points: list[np.ndarray], weights: list[np.ndarray], start: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the distinct sums of every combination of rows and their weights."""
+    totals = start[None, :]
+    total_weights = np.ones(1, dtype=np.int64)
+    for table, table_weights in zip(points, weights):
+        totals = (totals[:, None, :] + table[None, :, :]).reshape(-1, len(start))
+        total_weights = np.outer(total_weights, table_weights).ravel()
+        totals, inverse = np.unique(totals, axis=0, return_inverse=True)
+        total_weights = np.bincount(
+            inverse.ravel(), weights=total_weights, minlength=len(totals)
+        ).astype(np.int64)
+    return totals, total_weights
@@ -0,0 +1,410 @@
+"""Monte Carlo simulation of the rest of a played round and the Champions round."""
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, partial
+
+import numpy as np
+import pandas as pd
+
+from deepwellcup.utils.round_data import RoundData
+
+from .points import InputError
+from .points_systems import points_system
+from .scenarios import RoundScenarios, SeriesTable
+
+BATCH_SIZE = 2**15
+SLOTS = ("East", "West")
+# team codes of a missing selection and of a finalist that cannot be drawn
+NO_PICK = -1
+NO_TEAM = -2
+
+
+class SeriesOdds(typing.NamedTuple):
+    """Probabilities of the outcomes of a series.
+
+    The durations are the probabilities of each number of games, in the order
+    of the series duration options of the round.
+    """
+
+    higher_seed: float
+    durations: tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class SeriesModel:
+    """Outcomes of an open series with their probabilities and points rows."""
+
+    points: np.ndarray
+    rows: np.ndarray
+    probabilities: np.ndarray
+    winners: np.ndarray
+    losers: np.ndarray
+
+
+@dataclass(frozen=True)
+class ChampionsModel:  # pylint: disable=R0902
+    """Champions selections and how the Stanley Cup finalists are drawn.
+
+    The finalists and winner are team codes, with NO_PICK when they are drawn.
+    The final is the index of the open series that is the Stanley Cup final,
+    or -1 when it is not open.
+    """
+
+    picks: np.ndarray
+    slots: np.ndarray
+    strengths: np.ndarray
+    finalists: np.ndarray
+    winner: int
+    final: int
+    winner_points: int
+    finalist_points: int
+    runnerup_points: int
+
+
+@dataclass(frozen=True)
+class SimulationModel:
+    """Everything needed to draw and score samples, without the database."""
+
+    current: np.ndarray
+    alive: np.ndarray
+    series: tuple[SeriesModel, ...]
+    champions: ChampionsModel | None
+
+
+@dataclass
+class PlayoffSimulation:
+    """Simulation of the remaining outcomes of a played round.
+
+    Without odds or strengths, the consensus of the selections is used. The
+    previous points should not contain the Champions points.
+    """
+
+    round_data: RoundData
+    odds: typing.Mapping[str, SeriesOdds] | None = None
+    strengths: typing.Mapping[str, float] | None = None
+    previous: pd.Series | None = None
+
+    @cached_property
+    def _champions_selections(self) -> pd.DataFrame:
+        with self.round_data.database as db:
+            return db.get_champions_selections(self.round_data.year)
+
+    @cached_property
+    def _champions_results(self) -> pd.Series:
+        with self.round_data.database as db:
+            return db.get_champions_results(self.round_data.year)
+
+    @cached_property
+    def scenarios(self) -> RoundScenarios:
+        """Return the scenarios of the open series of the round."""
+        selections = self._champions_selections
+        individuals = (
+            pd.Index([])
+            if selections.empty
+            else selections.index.get_level_values("Individual").unique()
+        )
+        previous = (
+            self.previous if self.previous is not None else pd.Series(dtype="int64")
+        )
+        return RoundScenarios(
+            self.round_data,
+            previous.reindex(previous.index.union(individuals), fill_value=0),
+        )
+
+    @property
+    def individuals(self) -> pd.Index:
+        """Return the individuals in the simulation."""
+        return self.scenarios.current.index
+
+    @cached_property
+    def teams(self) -> list[str]:
+        """Return every team in the round or in the Champions selections."""
+        with self.round_data.database as db:
+            series = db.get_series(self.scenarios.round_info)
+        columns = [*SLOTS, "Stanley Cup"]
+        picks = self._champions_selections.reindex(columns=columns).stack()
+        results = self._champions_results.reindex(columns).dropna()
+        teams = (
+            set(series["Higher Seed"])
+            | set(series["Lower Seed"])
+            | set(picks)
+            | set(results)
+        )
+        return sorted(str(team) for team in teams)
+
+    @cached_property
+    def model(self) -> SimulationModel:
+        """Return the model of the samples."""
+        codes = {team: code for code, team in enumerate(self.teams)}
+        alive = np.zeros(len(self.teams), dtype=bool)
+        with self.round_data.database as db:
+            series = db.get_series(self.scenarios.round_info)
+        alive[[codes[team] for team in series["Higher Seed"]]] = True
+        alive[[codes[team] for team in series["Lower Seed"]]] = True
+        if self.scenarios.round_info.played_round == "Q":
+            alive[:] = True
+        results = self.round_data.results.series
+        for (_, name), winner in results["Team"].dropna().items():
+            seeds = series.set_index("Name").loc[name]
+            loser = (
+                seeds["Lower Seed"]
+                if winner == seeds["Higher Seed"]
+                else seeds["Higher Seed"]
+            )
+            alive[codes[loser]] = False
+        return SimulationModel(
+            current=self.scenarios.current.to_numpy(dtype=np.int64),
+            alive=alive,
+            series=tuple(
+                self._series_model(table, codes) for table in self.scenarios.tables
+            ),
+            champions=self._champions_model(codes),
+        )
+
+    def _series_model(self, table: SeriesTable, codes: dict[str, int]) -> SeriesModel:
+        """Return the outcomes of a series with their probabilities."""
+        seeds = self.scenarios.open_series.xs(table.name, level="Series").iloc[0]
+        odds = self._series_odds(table.name, seeds)
+        options = self.scenarios.round_info.series_duration_options
+        outcomes = [outcome for group in table.outcomes for outcome in group]
+        rows = [row for row, group in enumerate(table.outcomes) for _ in group]
+        probabilities = [
+            (
+                odds.higher_seed
+                if outcome.team == seeds["Higher Seed"]
+                else 1 - odds.higher_seed
+            )
+            * odds.durations[options.index(outcome.duration)]
+            for outcome in outcomes
+        ]
+        teams = (seeds["Higher Seed"], seeds["Lower Seed"])
+        return SeriesModel(
+            points=table.points,
+            rows=np.array(rows),
+            probabilities=np.array(probabilities),
+            winners=np.array([codes[outcome.team] for outcome in outcomes]),
+            losers=np.array(
+                [
+                    codes[teams[1] if outcome.team == teams[0] else teams[0]]
+                    for outcome in outcomes
+                ]
+            ),
+        )
+
+    def _series_odds(self, name: str, seeds: pd.Series) -> SeriesOdds:
+        """Return the given odds of a series or the consensus of the picks."""
+        options = self.scenarios.round_info.series_duration_options
+        if self.odds is not None:
+            if name not in self.odds:
+                raise InputError(f"The odds of {name} are missing.")
+            odds = self.odds[name]
+            if not 0 <= odds.higher_seed <= 1:
+                raise InputError(f"The odds of {name} must be between 0 and 1.")
+            if len(odds.durations) != len(options) or not np.isclose(
+                sum(odds.durations), 1
+            ):
+                raise InputError(f"The durations of {name} must add to 1.")
+            return odds
+        selections = self.round_data.selections.series
+        picks = selections[selections.index.get_level_values("Series") == name]
+        # the share of the picks, smoothed by one pick for every option
+        higher_seed = (int((picks["Team"] == seeds["Higher Seed"]).sum()) + 1) / (
+            len(picks) + 2
+        )
+        durations = tuple(
+            (int((picks["Duration"] == duration).sum()) + 1)
+            / (len(picks) + len(options))
+            for duration in options
+        )
+        return SeriesOdds(higher_seed, durations)
+
+    def _champions_model(self, codes: dict[str, int]) -> ChampionsModel | None:
+        """Return the model of the Champions round, if it is played."""
+        year = self.round_data.year
+        selections = self._champions_selections
+        if selections.empty:
+            return None
+        individuals = list(self.individuals)
+        picks = np.full((len(individuals), 3), NO_PICK)
+        for column, slot in enumerate([*SLOTS, "Stanley Cup"]):
+            for individual, team in selections[slot].dropna().items():
+                picks[individuals.index(individual), column] = codes[team]
+        results = self._champions_results
+        finalists = np.array(
+            [codes[results[slot]] if slot in results else NO_PICK for slot in SLOTS]
+        )
+        winner = results.get("Stanley Cup")
+        final = (
+            0
+            if self.scenarios.round_info.played_round == 4 and self.scenarios.tables
+            else -1
+        )
+        system = points_system(year)
+        return ChampionsModel(
+            picks=picks,
+            slots=self._slots(codes),
+            strengths=self._strengths(codes),
+            finalists=finalists,
+            winner=codes[winner] if isinstance(winner, str) else NO_PICK,
+            final=final,
+            winner_points=int(system["stanley_cup_winner"]),
+            finalist_points=int(system.get("stanley_cup_finalist", 0)),
+            runnerup_points=int(system.get("stanley_cup_runnerup", 0)),
+        )
+
+    def _slots(self, codes: dict[str, int]) -> np.ndarray:
+        """Return the finalist slot of each team, or -1 when it is not known.
+
+        The slot is the conference of the series of the team in the round, or
+        else the Champions column the team was picked in most often.
+        """
+        slots = np.full(len(codes), -1)
+        picked = pd.concat(
+            [
+                self._champions_selections[slot].dropna().value_counts().rename(slot)
+                for slot in SLOTS
+            ],
+            axis=1,
+        ).fillna(0)
+        for team, counts in picked.iterrows():
+            slots[codes[str(team)]] = int(np.argmax(counts.to_numpy()))
+        for slot, team in enumerate(self._champions_results.reindex(SLOTS)):
+            if isinstance(team, str):
+                slots[codes[team]] = slot
+        with self.round_data.database as db:
+            series = db.get_series(self.scenarios.round_info).reset_index()
+        for conference, higher_seed, lower_seed in series[
+            ["Conference", "Higher Seed", "Lower Seed"]
+        ].itertuples(index=False, name=None):
+            if conference in SLOTS:
+                slots[[codes[higher_seed], codes[lower_seed]]] = SLOTS.index(conference)
+        return slots
+
+    def _strengths(self, codes: dict[str, int]) -> np.ndarray:
+        """Return the given strength of each team or the consensus of the picks."""
+        if self.strengths is not None:
+            return np.array([float(self.strengths.get(team, 0)) for team in codes])
+        counts = (
+            self._champions_selections[[*SLOTS, "Stanley Cup"]]
+            .stack()
+            .value_counts()
+            .reindex(list(codes), fill_value=0)
+        )
+        return counts.to_numpy(dtype=float) + 1
+
+    def run(
+        self, samples: int = 100_000, seed: int = 0, processes: int = 1
+    ) -> pd.DataFrame:
+        """Return the probability of each final rank of every individual.
+
+        Individuals tied on points share the best of their ranks.
+        """
+        sizes = [BATCH_SIZE] * (samples // BATCH_SIZE)
+        if samples % BATCH_SIZE:
+            sizes.append(samples % BATCH_SIZE)
+        # each batch has its own seed, so the processes do not change the result
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        simulate = partial(simulate_batch, self.model)
+        if processes > 1:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                counts = list(executor.map(simulate, seeds, sizes))
+        else:
+            counts = list(map(simulate, seeds, sizes))
+        ranks = pd.DataFrame(
+            sum(counts, np.zeros((len(self.individuals),) * 2)) / samples,
+            index=self.individuals.rename("Individual"),
+            columns=pd.RangeIndex(1, len(self.individuals) + 1, name="Rank"),
+        )
+        mean_rank = ranks.to_numpy() @ ranks.columns.to_numpy()
+        return ranks.iloc[np.argsort(mean_rank, kind="stable")]
+
+
+def simulate_batch(
+    model: SimulationModel, seed: np.random.SeedSequence, size: int
+) -> np.ndarray:
+    """Return the number of times each individual finishes in each rank."""
+    rng = np.random.default_rng(seed)
+    totals = np.tile(model.current, (size, 1))
+    alive = np.tile(model.alive, (size, 1))
+    winners = []
+    for series in model.series:
+        outcomes = rng.choice(
+            len(series.probabilities),
+            size=size,
+            p=series.probabilities / series.probabilities.sum(),
+        )
+        totals += series.points[series.rows[outcomes]]
+        winners.append(series.winners[outcomes])
+        alive[np.arange(size), series.losers[outcomes]] = False
+    if model.champions is not None:
+        champions = model.champions
+        if champions.final >= 0:
+            alive = np.tile(model.alive, (size, 1))
+        finalists = _draw_finalists(rng, champions, alive)
+        if champions.winner != NO_PICK:
+            winner = np.full(size, champions.winner)
+        elif champions.final >= 0:
+            winner = winners[champions.final]
+        else:
+            winner = _draw_winner(rng, champions, finalists)
+        totals += finals_points(champions, finalists, winner)
+    ranks = 1 + (totals[:, None, :] > totals[:, :, None]).sum(axis=2)
+    individuals = np.arange(len(model.current))
+    return np.bincount(
+        (individuals * len(individuals) + ranks - 1).ravel(),
+        minlength=len(individuals) ** 2,
+    ).reshape(len(individuals), len(individuals))
+
+
+def _draw(rng: np.random.Generator, weights: np.ndarray) -> np.ndarray:
+    """Return an index drawn from each row of weights, or -1 when all are 0."""
+    cumulative = weights.cumsum(axis=1)
+    draws = rng.random(len(weights)) * cumulative[:, -1]
+    index = (cumulative <= draws[:, None]).sum(axis=1)
+    return np.where(cumulative[:, -1] > 0, np.minimum(index, weights.shape[1] - 1), -1)
+
+
+def _draw_finalists(
+    rng: np.random.Generator, champions: ChampionsModel, alive: np.ndarray
+) -> np.ndarray:
+    """Return the codes of the East and West finalists of each sample."""
+    finalists = np.tile(champions.finalists, (len(alive), 1))
+    for slot, fixed in enumerate(champions.finalists):
+        if fixed != NO_PICK:
+            continue
+        weights = alive * (champions.slots == slot) * champions.strengths
+        drawn = _draw(rng, weights)
+        finalists[:, slot] = np.where(drawn >= 0, drawn, NO_TEAM)
+    return finalists
+
+
+def _draw_winner(
+    rng: np.random.Generator, champions: ChampionsModel, finalists: np.ndarray
+) -> np.ndarray:
+    """Return the code of the Stanley Cup winner of each sample."""
+    known = finalists != NO_TEAM
+    weights = np.where(known, champions.strengths[finalists], 0)
+    drawn = _draw(rng, weights)
+    return np.where(drawn >= 0, finalists[np.arange(len(finalists)), drawn], NO_TEAM)
+
+
+def finals_points(
+    champions: ChampionsModel, finalists: np.ndarray, winner: np.ndarray
+) -> np.ndarray:
+    """Return the Champions points of every individual for each final.
+
+    Each row of finalists holds the East and West finalists, and winner holds
+    the Stanley Cup winner of the same row.
+    """
+    east, west, cup = (champions.picks[:, column] for column in range(3))
+    points = champions.winner_points * (cup == winner[:, None])
+    if champions.finalist_points:
+        for pick in (east, west):
+            picked = (pick == finalists[:, :1]) | (pick == finalists[:, 1:])
+            points += champions.finalist_points * picked
+    if champions.runnerup_points:
+        picked_runnerup = np.where(east != cup, east, west)
+        runnerup = np.where(finalists[:, 0] != winner, finalists[:, 0], finalists[:, 1])
+        points += champions.runnerup_points * (picked_runnerup == runnerup[:, None])
+    return points
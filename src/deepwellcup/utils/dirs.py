@@ -24,6 +24,11 @@ def database():
     return data() / "database"
 
 
+def migrations():
+    """Return the path to the database migrations directory"""
+    return database() / "migrations"
+
+
 def templates():
     """Return the path to the templates directory"""
     return data() / "templates"
@@ -1,9 +1,10 @@
 """Round selections and results classes."""
 from dataclasses import dataclass, field
+from functools import cached_property
 
 import pandas as pd
 
-from deepwellcup.core.database import DataBase
+from deepwellcup.core.database import DataSource
 
 from .utils import PlayedRound, RoundInfo, SelectionRound
 
@@ -18,7 +19,7 @@ class RoundData:
 
     year: int
     selection_round: SelectionRound
-    database: DataBase
+    database: DataSource
 
     def __post_init__(self):
         if self.selection_round == "Champions":
@@ -31,14 +32,35 @@ class RoundData:
             self.results = PlayedResults(self.year, self.selection_round, self.database)
         self.other_points = OtherPoints(self.year, self.selection_round, self.database)
 
+    def reload(self) -> None:
+        """Discard the loaded selections, results and other points."""
+        self.selections.reload()
+        self.results.reload()
+        self.other_points.reload()
+
+
+class LoadedFrames:  # pylint: disable=R0903
+    """Frames loaded from the database once and kept until reloaded."""
+
+    def reload(self) -> None:
+        """Discard the loaded frames so they are read again when next used.
+
+        Each frame is read from the database the first time it is used and
+        kept, so call this after the database changes.
+        """
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, cached_property):
+                    self.__dict__.pop(name, None)
+
 
 @dataclass
-class BasePlayedRound:
+class BasePlayedRound(LoadedFrames):
     """Selections, results, and other points in a played round."""
 
     year: int
     selection_round: PlayedRound
-    database: DataBase
+    database: DataSource
     _round_info: RoundInfo = field(init=False)
 
     def __post_init__(self) -> None:
@@ -49,13 +71,13 @@ class BasePlayedRound:
 class PlayedSelections(BasePlayedRound):
     """All selections for a played round."""
 
-    @property
+    @cached_property
     def series(self) -> pd.DataFrame:
         """Selections."""
         with self.database as db:
             return db.get_round_selections(self._round_info)
 
-    @property
+    @cached_property
     def overtime(self) -> pd.Series:
         """Overtime selections."""
         with self.database as db:
@@ -66,13 +88,13 @@ class PlayedSelections(BasePlayedRound):
 class PlayedResults(BasePlayedRound):
     """All results for a played round."""
 
-    @property
+    @cached_property
     def series(self) -> pd.DataFrame:
         """Results."""
         with self.database as db:
             return db.get_round_results(self._round_info)
 
-    @property
+    @cached_property
     def overtime(self) -> str:
         """Overtime results."""
         with self.database as db:
@@ -80,14 +102,14 @@ class PlayedResults(BasePlayedRound):
 
 
 @dataclass
-class ChampionsSelections:
+class ChampionsSelections(LoadedFrames):
     """All selections for the champions round."""
 
     year: int
     selection_round = "Champions"
-    database: DataBase
+    database: DataSource
 
-    @property
+    @cached_property
     def champions(self) -> pd.DataFrame:
         """Selections."""
         with self.database as db:
@@ -95,14 +117,14 @@ class ChampionsSelections:
 
 
 @dataclass
-class ChampionsResults:
+class ChampionsResults(LoadedFrames):
     """All results for the champions round."""
 
     year: int
     selection_round = "Champions"
-    database: DataBase
+    database: DataSource
 
-    @property
+    @cached_property
     def champions(self) -> pd.DataFrame:
         """Results."""
         with self.database as db:
@@ -113,7 +135,7 @@ class ChampionsResults:
 class OtherPoints(BasePlayedRound):
     """Other points for a played round."""
 
-    @property
+    @cached_property
     def points(self) -> pd.Series:
         """Results."""
         if self.selection_round == "Champions":
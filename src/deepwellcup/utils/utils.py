@@ -82,6 +82,15 @@ class RoundInfo:
             return (3, 4, 5)
         return (4, 5, 6, 7)
 
+    @property
+    def number_of_series(self) -> int:
+        """Number of series played in the round."""
+        if self.played_round == "Q":
+            if self.year != 2020:
+                raise ValueError('Only 2020 has round "Q"')
+            return 8
+        return 2 ** (4 - self.played_round)
+
 
 class SeriesInfo(typing.NamedTuple):
     """Information about a played series."""
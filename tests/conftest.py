@@ -1,7 +1,22 @@
 """Default test database configuration."""
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+import pandas as pd
 import pytest
 
+from deepwellcup.core.database import DataBase
+from deepwellcup.ingest.files import SelectionsFile
+from deepwellcup.ingest.parse_files.files import FileResults
+from deepwellcup.ingest.update_results import insert_data, update_series_result
+from deepwellcup.ingest.update_selections import insert_selections
 from deepwellcup.utils import dirs
+from deepwellcup.utils.utils import (
+    DataStores,
+    PlayedRound,
+    RoundInfo,
+    SelectionRound,
+)
 
 
 def pytest_configure():
@@ -9,3 +24,74 @@ def pytest_configure():
     project = dirs.src().parents[1]
     pytest.test_data_dir = project / "tests/data"
     pytest.data_dir = project / "src/deepwellcup/data"
+
+
+@dataclass
+class Ingest:
+    """Database of a year filled from its data files by the ingest commands."""
+
+    datastores: DataStores
+    database: DataBase
+    year: int = 2017
+
+    def selections(self, *selection_rounds: SelectionRound) -> None:
+        """Insert the selections of the rounds."""
+        for selection_round in selection_rounds:
+            insert_selections(
+                self.year, selection_round, self.datastores, self.database
+            )
+
+    def results(self, *played_rounds: PlayedRound) -> None:
+        """Insert the results and other points of the rounds."""
+        for played_round in played_rounds:
+            insert_data(self.year, played_round, self.datastores, self.database)
+
+    def series_results(self, played_round: PlayedRound, *series: str) -> pd.Series:
+        """Insert the results of single series and return the running totals."""
+        totals = pd.Series(dtype="Int64")
+        for name in series:
+            totals = update_series_result(
+                self.year, played_round, name, self.datastores, self.database
+            )
+        return totals
+
+    def series(self, played_round: PlayedRound) -> list[str]:
+        """Return the names of the series in a played round."""
+        round_info = RoundInfo(year=self.year, played_round=played_round)
+        with self.database as db:
+            return db.get_series(round_info)["Name"].to_list()
+
+    def file_results(self, played_round: PlayedRound) -> pd.DataFrame:
+        """Return the results of a played round from its data file."""
+        return FileResults(
+            SelectionsFile(
+                year=self.year,
+                selection_round=played_round,
+                directory=self.datastores.raw_data_directory,
+            )
+        ).results()  # type: ignore[return-value]
+
+
+@pytest.fixture(name="ingest_year")
+def fixture_ingest_year(tmp_path) -> Iterator[Callable[[int], Ingest]]:
+    """Return a function giving an empty database of a year to fill."""
+    databases = []
+
+    def empty_database(year: int) -> Ingest:
+        datastores = DataStores(
+            raw_data_directory=pytest.data_dir  # pylint: disable=E1101
+            / f"selections_and_results/{year}",
+            database=tmp_path / f"{year}.db",
+        )
+        databases.append(DataBase(datastores.database))
+        return Ingest(datastores, databases[-1], year)
+
+    yield empty_database
+    for database in databases:
+        database.close()
+
+
+@pytest.fixture(name="ingest")
+def fixture_ingest(ingest_year) -> Ingest:
+    """Return an empty 2017 database to fill from the packaged data files."""
+    return ingest_year(2017)
@@ -1,4 +1,6 @@
 """Tests for database."""
+import sqlite3
+
 import numpy as np
 import pandas as pd
 from pytest import raises
@@ -7,13 +9,47 @@ from deepwellcup.core.database import (
     DataBase,
     DuplicateEntryError,
     PlayedRoundError,
+    ReadOnlyDataBase,
+    ReadOnlyError,
+    StatementCounts,
     YearError,
     check_played_round,
     check_year,
+    migration_files,
+    open_database,
+    txt_files_in_dir,
 )
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.utils import dirs
+from deepwellcup.utils.round_data import RoundData
 from deepwellcup.utils.utils import RoundInfo
 
 
+def test_schema_version(tmp_path):
+    """Test that a new database has every migration applied."""
+    database = DataBase(tmp_path / "schema.db")
+    latest_version = migration_files(dirs.migrations())[-1][0]
+    assert database.schema_version == latest_version
+
+
+def test_migrate_existing_database(tmp_path):
+    """Test that an existing database without migrations is upgraded in place."""
+    db_path = tmp_path / "existing.db"
+    conn = sqlite3.connect(db_path)
+    for file in txt_files_in_dir(dirs.database()):
+        conn.execute(file.read_text(encoding="utf-8"))
+    conn.close()
+    database = DataBase(db_path)
+    latest_version = migration_files(dirs.migrations())[-1][0]
+    assert database.schema_version == latest_version
+    conn = sqlite3.connect(db_path)
+    indexes = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index'"
+    ).fetchall()
+    conn.close()
+    assert ("StanleyCupSelectionsYear",) in indexes
+
+
 def test_individuals(tmp_path):
     """Test for add and get individuals."""
     database = DataBase(tmp_path / "individuals.db")
@@ -24,6 +60,166 @@ def test_individuals(tmp_path):
     assert received == individuals
 
 
+def test_connection_reuse(tmp_path):
+    """Test that repeated and nested with blocks reuse a pooled connection."""
+    database = DataBase(tmp_path / "pool.db")
+    with database as db:
+        db.add_individuals(["David D"])
+        with database as inner_db:
+            assert inner_db.get_individuals() == ["David D"]
+        assert db.get_individuals() == ["David D"]
+    for _ in range(3):
+        with database as db:
+            db.get_individuals()
+    database.close()
+    assert database.connections_opened == 1
+
+
+def test_pool_size_error(tmp_path):
+    """Test for an invalid pool size."""
+    with raises(ValueError):
+        DataBase(tmp_path / "pool.db", pool_size=0)
+
+
+def test_journal_mode(tmp_path):
+    """Test that the database is opened in WAL mode."""
+    database = DataBase(tmp_path / "wal.db", busy_timeout=1, synchronous="full")
+    assert database.journal_mode == "wal"
+    assert database.synchronous == "FULL"
+    with database as db:
+        assert db.fetch("individuals", (0,)) == []
+
+
+def test_synchronous_error(tmp_path):
+    """Test for an invalid synchronous level."""
+    with raises(ValueError):
+        DataBase(tmp_path / "sync.db", synchronous="sometimes")
+
+
+def test_read_only_database(tmp_path):
+    """Test reading while another connection writes."""
+    database = DataBase(tmp_path / "read_only.db")
+    with database as db:
+        db.add_individuals(["David D"])
+    reader = ReadOnlyDataBase(tmp_path / "read_only.db")
+    writer = sqlite3.connect(tmp_path / "read_only.db")
+    writer.execute("BEGIN IMMEDIATE")
+    writer.execute("INSERT INTO Individuals(FirstName, LastName) VALUES ('Kyle', 'L')")
+    with reader as db:
+        assert db.get_individuals() == ["David D"]
+        with raises(ReadOnlyError):
+            db.add_individuals(["Harry L"])
+    writer.rollback()
+    writer.close()
+    with raises(FileNotFoundError):
+        ReadOnlyDataBase(tmp_path / "missing.db")
+
+
+def test_transaction(tmp_path):
+    """Test that a transaction is committed once when it ends."""
+    database = DataBase(tmp_path / "transaction.db")
+    with database.transaction() as db:
+        db.add_individuals(["David D"])
+        with db.transaction():
+            db.add_individuals(["Kyle L"])
+        assert db.in_transaction
+        reader = sqlite3.connect(tmp_path / "transaction.db")
+        assert reader.execute("SELECT * FROM Individuals").fetchall() == []
+    assert reader.execute("SELECT COUNT(*) FROM Individuals").fetchone() == (2,)
+    reader.close()
+
+
+def test_transaction_rollback(tmp_path):
+    """Test that a failed transaction leaves no rows behind."""
+    database = DataBase(tmp_path / "rollback.db")
+    with database as db:
+        db.add_individuals(["David D"])
+    with raises(DuplicateEntryError):
+        with database.transaction() as db:
+            db.add_individuals(["Kyle L"])
+            db.add_individuals(["David D"])
+    with database as db:
+        assert db.get_individuals() == ["David D"]
+
+
+def test_in_memory(tmp_path):
+    """Test that an in-memory database is only written to disk when saved."""
+    db_path = tmp_path / "memory.db"
+    database = DataBase(db_path, in_memory=True)
+    with database as db:
+        db.add_individuals(["David D"])
+    assert not db_path.exists()
+    database.save()
+    database.close()
+    database = DataBase(db_path, in_memory=True)
+    with database as db:
+        db.add_individuals(["Kyle L"])
+    database.close()
+    with DataBase(db_path) as db:
+        assert db.get_individuals() == ["David D"]
+
+
+def test_save_with_reader(tmp_path):
+    """Test that saving an in-memory database keeps open readers working."""
+    db_path = tmp_path / "save.db"
+    with DataBase(db_path) as db:
+        db.add_individuals(["David D"])
+    reader = ReadOnlyDataBase(db_path)
+    with reader as db:
+        assert db.get_individuals() == ["David D"]
+    database = DataBase(db_path, in_memory=True)
+    with database as db:
+        db.add_individuals(["Kyle L"])
+    database.save()
+    database.close()
+    with ReadOnlyDataBase(db_path) as db:
+        assert db.get_individuals() == ["David D", "Kyle L"]
+    with reader as db:
+        assert db.fetch("individuals", (0,)) == [(1, "David", "D"), (2, "Kyle", "L")]
+    reader.close()
+
+
+def test_individuals_identity_map(tmp_path):
+    """Test that the identity map stays coherent when adding individuals."""
+    database = DataBase(tmp_path / "individuals.db")
+    with database as db:
+        db.add_individuals(["David D"])
+        assert db.get_ids_with_individuals() == {1: "David D"}
+        db.add_individuals(["Brian M", "Kyle L"])
+        received = db.get_individuals_with_ids()
+    assert received == {"David D": 1, "Brian M": 2, "Kyle L": 3}
+
+
+def test_individuals_added_by_writer(tmp_path):
+    """Test that a reader finds individuals added by another connection."""
+    db_path = tmp_path / "writer.db"
+    round_info = RoundInfo(year=2010, played_round=1)
+    writer = DataBase(db_path)
+    with writer as db:
+        db.add_individuals(["David D"])
+        db.add_monikers(round_info, {"David D": "Nazzy"})
+    reader = ReadOnlyDataBase(db_path)
+    with reader as db:
+        assert db.get_monikers(round_info) == {"David D": "Nazzy"}
+    with writer as db:
+        db.add_individuals(["Kyle L"])
+        db.add_monikers(round_info, {"Kyle L": "Kyle"})
+    with reader as db:
+        received = db.get_monikers(round_info)
+    assert received == {"David D": "Nazzy", "Kyle L": "Kyle"}
+    reader.close()
+    writer.close()
+
+
+def test_statement_counts(tmp_path):
+    """Test for counting repeated statements."""
+    database = DataBase(tmp_path / "statements.db")
+    with database as db:
+        for year in [2010, 2011, 2012]:
+            db.get_overtime_results(RoundInfo(year=year, played_round=1))
+    assert database.statement_counts() == StatementCounts(repeated=2, first=1)
+
+
 def test_add_individuals_error(tmp_path):
     """Test for add and get individuals."""
     database = DataBase(tmp_path / "individuals.db")
@@ -338,6 +534,114 @@ def test_other_points(tmp_path):
     assert received.equals(other_points)
 
 
+def test_read_season(tmp_path):
+    """Test that reading a season reuses the pooled connection."""
+    database = DataBase(tmp_path / "read_season.db")
+    with database as db:
+        db.add_individuals(["David D"])
+    opened = database.connections_opened
+    for _ in range(2):
+        assert database.read_season(2017).individuals == {1: "David D"}
+    assert database.connections_opened == opened
+    with open_database(None, database) as db:
+        assert db is database
+    assert database.read_season(2017).year == 2017
+    database.close()
+
+
+def test_load_season(tmp_path):
+    """Test for the season snapshot matching the database getters."""
+    database = DataBase(tmp_path / "season.db")
+    rounds = {
+        1: ("Tampa Bay Lightning", "Boston Bruins"),
+        2: ("Washington Capitals", "Pittsburgh Penguins"),
+    }
+    with database as db:
+        db.add_individuals(["Kyle L", "Harry L"])
+        for played_round, (higher_seed, lower_seed) in rounds.items():
+            round_info = RoundInfo(year=2018, played_round=played_round)
+            series = pd.DataFrame(
+                {
+                    "Conference": ["East"],
+                    "Series Number": [1],
+                    "Name": ["TBL-BOS"],
+                    "Higher Seed": [higher_seed],
+                    "Lower Seed": [lower_seed],
+                    "Player on Higher Seed": [None],
+                    "Player on Lower Seed": [None],
+                },
+            ).set_index(["Conference", "Series Number"])
+            db.add_series(round_info, series)
+            db.add_preferences(
+                round_info,
+                pd.Series({"Kyle L": higher_seed}),
+                pd.Series({"Kyle L": lower_seed}),
+            )
+            db.add_overtime_results(round_info, str(played_round))
+        other_points = pd.Series({"Harry L": 50}).rename("Other Points")
+        other_points.attrs = {"Selection Round": 2, "Year": 2018}
+        db.add_other_points(other_points)
+    season = database.load_season(2018)
+    for played_round in rounds:
+        round_info = RoundInfo(year=2018, played_round=played_round)
+        with database as db:
+            assert season.get_series(round_info).equals(db.get_series(round_info))
+            assert season.get_other_points(round_info).equals(
+                db.get_other_points(round_info)
+            )
+            assert season.get_overtime_results(round_info) == db.get_overtime_results(
+                round_info
+            )
+            for received, expected in zip(
+                season.get_preferences(round_info), db.get_preferences(round_info)
+            ):
+                assert received.equals(expected)
+    with raises(YearError):
+        season.get_series(RoundInfo(year=2019, played_round=1))
+
+
+def test_round_points(ingest):
+    """Test that the SQL round points match the selection points."""
+    database = ingest.database
+    for played_round in [1, 2]:
+        ingest.selections(played_round)
+        ingest.results(played_round)
+        round_info = RoundInfo(year=2017, played_round=played_round)
+        expected = RoundPoints(RoundData(2017, played_round, database)).selection
+        with database as db:
+            received = db.get_round_points(round_info)
+        assert received.equals(expected)
+        assert received.name == expected.name
+    with raises(NotImplementedError):
+        with database as db:
+            db.get_round_points(RoundInfo(year=2018, played_round=1))
+
+
+def test_points(tmp_path):
+    """Test for replace and get the stored points."""
+    database = DataBase(tmp_path / "stored_points.db")
+    points = pd.DataFrame(
+        {
+            "Year": 2021,
+            "Round": 1,
+            "Individual": ["Harry L", "Kyle L", "Harry L"],
+            "Component": ["Selection", "Selection", "Other"],
+            "Points": pd.array([30, None, 50], dtype="Int64"),
+        }
+    )
+    with database as db:
+        db.add_individuals(["Harry L", "Kyle L"])
+        db.replace_points(2021, 1, points.iloc[:2])
+        db.replace_points(2021, 1, points)
+        db.replace_points(2021, "Champions", points.iloc[:1])
+        received = db.get_points(2021, 2021)
+        standings = db.get_standings(2021)
+    assert received.columns.to_list() == points.columns.to_list()
+    assert len(received) == 4
+    assert received["Points"].sum() == 110
+    assert standings.to_dict() == {"Harry L": 110, "Kyle L": 0}
+
+
 def test_check_year():
     """Test for check_year."""
     check_year(2009)
@@ -0,0 +1,58 @@
+"""Tests for elimination."""
+from deepwellcup.points.elimination import (
+    Elimination,
+    later_rounds_range,
+    previous_points,
+)
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.utils.round_data import RoundData
+from deepwellcup.utils.utils import RoundInfo
+
+
+def test_elimination_final(ingest):
+    """Test for the maximum totals and elimination before the final ends."""
+    ingest.selections("Champions", 3, 4)
+    ingest.results(3)
+    database = ingest.database
+    elimination = Elimination(
+        RoundData(2017, 4, database), previous_points(2017, 4, database)
+    )
+    summary = elimination.summary
+    assert len(elimination.finals) == 2
+    ingest.results(4)
+    champions = RoundPoints(RoundData(2017, "Champions", database)).selection
+    total = (
+        RoundPoints(RoundData(2017, 3, database))
+        .total.add(RoundPoints(RoundData(2017, 4, database)).total, fill_value=0)
+        .add(champions.fillna(0), fill_value=0)
+    )
+    assert (summary.loc[:, "Maximum"] >= total.reindex(summary.index)).all()
+    assert (summary.loc[:, "Maximum"] >= summary.loc[:, "Current"]).all()
+    leaders = total[total == total.max()].index
+    assert not summary.loc[leaders, "Eliminated"].any()
+    assert summary.loc[:, "Eliminated"].any()
+
+
+def test_elimination_without_champions(ingest_year):
+    """Test for the elimination before the Champions selections are made."""
+    ingest = ingest_year(2020)
+    ingest.selections("Q")
+    ingest.results("Q")
+    database = ingest.database
+    summary = Elimination(
+        RoundData(2020, "Q", database), previous_points(2020, "Q", database)
+    ).summary
+    total = RoundPoints(RoundData(2020, "Q", database)).total
+    assert summary.loc[:, "Current"].to_dict() == total.to_dict()
+    assert (summary.loc[:, "Maximum"] > summary.loc[:, "Current"]).all()
+
+
+def test_later_rounds_range():
+    """Test for the fewest and most points of the later rounds."""
+    assert later_rounds_range(RoundInfo(played_round=4, year=2017)) == (0, 0)
+    assert later_rounds_range(RoundInfo(played_round=2, year=2017)) == (0, 2 * 15 + 30)
+    assert later_rounds_range(RoundInfo(played_round=3, year=2019)) == (0, 15 + 10 + 10)
+    assert later_rounds_range(RoundInfo(played_round="Q", year=2020)) == (
+        0,
+        (8 + 4 + 2 + 1) * 9,
+    )
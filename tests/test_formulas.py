@@ -0,0 +1,35 @@
+"""Tests for formulas."""
+import numpy as np
+from pytest import raises
+
+from deepwellcup.points.formulas import (
+    FormulaError,
+    compile_formula,
+    registered_formula,
+)
+
+
+def test_compile_formula():
+    """Test that compiled formulas are vectorized."""
+    formula = compile_formula("15-2*abs(P-C)")
+    assert formula(7, np.array([4, 7])).tolist() == [9, 15]
+
+
+def test_registered_formula():
+    """Test that a registered formula is compiled once."""
+    formula = registered_formula(2019, "played", "P+C-8")
+    assert registered_formula(2019, "played", "P+C-8") is formula
+    assert formula(7, np.array([4, 7])).tolist() == [3, 6]
+
+
+def test_compile_formula_operations():
+    """Test for the arithmetic supported in formulas."""
+    formula = compile_formula("-(C**2)/2 + abs(P-C)//1")
+    assert formula(np.array([2, 4]), 5).tolist() == [1.0, -7.0]
+
+
+def test_compile_formula_error():
+    """Test that formulas outside of the supported arithmetic are rejected."""
+    for formula in ["__import__('os')", "C.real", "max(C, P)", "X+1", "C+", "'a'"]:
+        with raises(FormulaError):
+            compile_formula(formula)
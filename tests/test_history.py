@@ -0,0 +1,53 @@
+"""Tests for history."""
+import sqlite3
+
+from deepwellcup.core.database import DataBase
+from deepwellcup.points.history import COLUMNS, compare_points, season_points
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.utils.round_data import RoundData
+
+
+def test_season_points(ingest):
+    """Test for the season points matching the round points."""
+    ingest.selections(1, 2)
+    ingest.results(1, 2)
+    database = ingest.database
+    table = season_points(database, 2016, 2017)
+    assert table.columns.to_list() == COLUMNS
+    assert set(table["Year"]) == {2017}
+    assert set(table["Component"]) == {"Selection"}
+    for played_round in [1, 2]:
+        expected = RoundPoints(RoundData(2017, played_round, database)).selection
+        received = table[table["Round"] == played_round].set_index("Individual")
+        assert received["Points"].to_dict() == expected.to_dict()
+
+
+def test_season_points_empty(tmp_path):
+    """Test for the season points of years without selections."""
+    table = season_points(DataBase(tmp_path / "empty.db"), 2006, 2007)
+    assert table.empty
+    assert table.columns.to_list() == COLUMNS
+
+
+def test_compare_points(ingest):
+    """Test for the stored points matching the points scored now."""
+    database = ingest.database
+    ingest.selections(1, "Champions", 2, 3, 4)
+    for played_round in [1, 2, 3, 4]:
+        ingest.results(played_round)
+        with database as db:
+            stored_rounds = set(db.get_points(2017, 2017)["Round"].astype(str))
+        assert ("Champions" in stored_rounds) == (played_round == 4)
+    assert compare_points(database, 2017, 2017).empty
+    with database as db:
+        standings = db.get_standings(2017)
+    scored = season_points(database, 2017, 2017)
+    assert standings.to_dict() == scored.groupby("Individual")["Points"].sum().to_dict()
+    conn = sqlite3.connect(ingest.datastores.database)
+    conn.execute(
+        "UPDATE Points SET Points = Points + 1 "
+        "WHERE rowid = (SELECT MIN(rowid) FROM Points WHERE Round = 2)"
+    )
+    conn.commit()
+    conn.close()
+    assert len(compare_points(database, 2017, 2017)) == 1
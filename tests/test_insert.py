@@ -19,6 +19,9 @@ class TempDataBase:
     def __exit__(self, exc_type, exc_value, exc_traceback):
         pass
 
+    def transaction(self):  # pylint: disable=C0116
+        return self
+
     def add_individuals(self, individuals: list[str]) -> None:  # pylint: disable=C0116
         pass
 
@@ -44,6 +47,11 @@ class TempDataBase:
     def add_round_results(self, selections) -> None:  # pylint: disable=C0116
         pass
 
+    def get_round_results(  # pylint: disable=C0116,W0613
+        self, round_info
+    ) -> pd.DataFrame:
+        return pd.DataFrame()
+
     def add_champions_selections(self, selections) -> None:  # pylint: disable=C0116
         pass
 
@@ -0,0 +1,92 @@
+"""Tests for playoff round."""
+import pandas as pd
+
+from deepwellcup.core.database import DataBase
+from deepwellcup.core.playoff_round import PlayoffRound
+from deepwellcup.utils.utils import RoundInfo
+
+
+def test_playoff_round_reads_once(ingest):
+    """Test for reading the data of a playoff round once until reloaded."""
+    ingest.selections(1)
+    database = ingest.database
+    playoff_round = PlayoffRound(2017, 1, database)
+
+    def read_all():
+        return (
+            playoff_round.preferences,
+            playoff_round.individuals,
+            playoff_round.monikers,
+            playoff_round.series,
+            playoff_round.players,
+            playoff_round.preferences_selected,
+            playoff_round.monikers_selected,
+            playoff_round.players_selected,
+            playoff_round.overtime_selected,
+        )
+
+    def queries():
+        return sum(database.statement_counts())
+
+    start = queries()
+    first = read_all()
+    loaded = queries()
+    assert loaded > start
+    for individual in playoff_round.individuals:
+        playoff_round.preferences[0].get(individual)
+        playoff_round.monikers.get(individual)
+    assert read_all()[0] is first[0]
+    assert queries() == loaded
+    playoff_round.reload()
+    read_all()
+    assert queries() - loaded == loaded - start
+
+
+def test_playoff_round_series_and_players(tmp_path):
+    """Test for the series and players of a playoff round."""
+    database = DataBase(tmp_path / "players.db")
+    round_info = RoundInfo(year=2019, played_round=3)
+    series = pd.DataFrame(
+        {
+            "Conference": ["West", "East"],
+            "Series Number": [1, 1],
+            "Name": ["SJS-STL", "BOS-CAR"],
+            "Higher Seed": ["San Jose Sharks", "Boston Bruins"],
+            "Lower Seed": ["St Louis Blues", "Carolina Hurricanes"],
+            "Player on Higher Seed": ["Brent Burns", "Brad Marchand"],
+            "Player on Lower Seed": ["Ryan O'Reilly", "Sebastian Aho"],
+        },
+    ).set_index(["Conference", "Series Number"])
+    selections = (
+        pd.DataFrame(
+            {
+                "Individual": ["Kyle L", "Kyle L"],
+                "Conference": ["East", "West"],
+                "Series": ["BOS-CAR", "SJS-STL"],
+                "Team": ["Carolina Hurricanes", "St Louis Blues"],
+                "Duration": [6, 7],
+                "Player": ["Sebastian Aho", "Brent Burns"],
+            },
+        )
+        .astype({"Duration": "Int64"})
+        .set_index(["Individual", "Conference", "Series"])
+    )
+    selections.attrs = {
+        "Selection Round": round_info.played_round,
+        "Year": round_info.year,
+    }
+    with database as db:
+        db.add_individuals(["Kyle L"])
+        db.add_series(round_info, series)
+        db.add_round_selections(selections)
+    playoff_round = PlayoffRound(2019, 3, database)
+    assert playoff_round.series == {"East": ["BOS-CAR"], "West": ["SJS-STL"]}
+    expected = pd.DataFrame(
+        {
+            "Conference": ["East", "West"],
+            "Series": ["BOS-CAR", "SJS-STL"],
+            "Higher Seed": ["Brad Marchand", "Brent Burns"],
+            "Lower Seed": ["Sebastian Aho", "Ryan O'Reilly"],
+        }
+    ).set_index(["Conference", "Series"])
+    assert playoff_round.players.equals(expected)
@@ -5,7 +5,8 @@ import pandas as pd
 import pytest
 
 from deepwellcup.core.database import DataBase
-from deepwellcup.points.points import RoundPoints
+from deepwellcup.points.points import RoundPoints, overtime_points
+from deepwellcup.points.points_systems import points_system
 from deepwellcup.utils.round_data import BasePlayedRound
 
 
@@ -174,3 +175,43 @@ def test_selection_points(round_inputs, selections, results, other_points, expec
 
     pts = RoundPoints(RoundData())
     assert pts.selection.equals(expected)
+
+
+def test_overtime_points():
+    """Test for overtime points, including selections one game off."""
+    selections = pd.Series(
+        {"Mark D": "3", "David D": "More than 3", "Kyle L": "1", "Harry L": ""}
+    )
+    received = overtime_points(selections, "3", points_system(2019))
+    assert received.to_dict() == {"Mark D": 10, "David D": 5, "Kyle L": 0, "Harry L": 0}
+    received = overtime_points(selections, "More than 3", points_system(2019))
+    assert received.to_dict() == {"Mark D": 5, "David D": 10, "Kyle L": 0, "Harry L": 0}
+    received = overtime_points(selections, "3", points_system(2018))
+    assert received.to_dict() == {"Mark D": 0, "David D": 0, "Kyle L": 0, "Harry L": 0}
+
+
+def test_round_points_invalidate():
+    """Test that points are computed once until they are invalidated."""
+
+    class CountingRoundData:  # pylint: disable=C0115,R0903
+        year = 2008
+        selection_round = 4
+        reads = 0
+        reloads = 0
+
+        @property
+        def other_points(self):  # pylint: disable=C0116
+            self.reads += 1
+            return OtherPointsEmpty(2008, 4, TempDataBase())
+
+        def reload(self):  # pylint: disable=C0116
+            self.reloads += 1
+
+    round_data = CountingRoundData()
+    points = RoundPoints(round_data)  # type: ignore[arg-type]
+    assert points.other is points.other
+    assert round_data.reads == 1
+    points.invalidate()
+    assert points.other is None
+    assert round_data.reads == 2
+    assert round_data.reloads == 1
@@ -0,0 +1,59 @@
+"""Tests for points systems."""
+import numpy as np
+import pytest
+
+from deepwellcup.points.points_systems import (
+    duration_points,
+    fixed_pick_points,
+    gradient_functions,
+    precompile,
+    series_points_range,
+)
+
+
+def test_fixed_pick_points():
+    """Test for the fixed points of the correct picks in a round."""
+    assert fixed_pick_points(2007, 1) == (10, 7, 2)
+    assert fixed_pick_points(2016, 4) == (20, 10, 0)
+    with pytest.raises(NotImplementedError):
+        fixed_pick_points(2019, 1)
+
+
+def test_gradient_functions():
+    """Test for the formulas of a round."""
+    f_correct, f_incorrect = gradient_functions(2019, 1)
+    assert gradient_functions(2019, 2) == (f_correct, f_incorrect)
+    assert f_correct(7, np.array([4, 7])).tolist() == [9, 15]
+    assert f_incorrect(7, np.array([4, 7])).tolist() == [3, 6]
+
+
+def test_duration_points():
+    """Test for the lookup tables of the formulas."""
+    tables = duration_points(2019, 1)
+    assert tables.correct[7, 4] == 9
+    assert tables.incorrect[5, 6] == 3
+    assert tables.correct[3, 4] == 0
+    assert not tables.correct.flags.writeable
+
+
+def test_duration_points_round_q():
+    """Test for the lookup tables of round Q."""
+    tables = duration_points(2020, "Q")
+    assert tables.correct[3, 3:6].tolist() == [8, 7, 6]
+    assert tables.incorrect[5, 5] == 4
+
+
+def test_series_points_range():
+    """Test for the fewest and most points of a series."""
+    assert series_points_range(2007, 1) == (0, 19)
+    assert series_points_range(2016, 4) == (0, 30)
+    assert series_points_range(2019, 2) == (0, 15)
+    assert series_points_range(2020, "Q") == (0, 8)
+
+
+def test_precompile():
+    """Test for precompiling the formulas of every points system."""
+    keys = precompile(2017, 2020)
+    assert (2020, "Q", "8-abs(P-C)") in keys
+    assert (2018, "played", "P+C-8") in keys
+    assert not [key for key in keys if key[0] == 2017]
@@ -0,0 +1,22 @@
+"""Tests for round data."""
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.utils.round_data import RoundData
+
+
+def test_round_data_reads_once(ingest):
+    """Test that scoring a round reads each table once until it is reloaded."""
+    ingest.selections(1)
+    ingest.results(1)
+    database = ingest.database
+    round_data = RoundData(2017, 1, database)
+    points = RoundPoints(round_data)
+    start = sum(database.statement_counts())
+    total = points.total
+    reads = sum(database.statement_counts()) - start
+    assert reads == 5
+    assert round_data.selections.series is round_data.selections.series
+    assert RoundPoints(round_data).total.equals(total)
+    assert sum(database.statement_counts()) - start == reads
+    points.invalidate()
+    assert points.total.equals(total)
+    assert sum(database.statement_counts()) - start == 2 * reads
@@ -0,0 +1,52 @@
+"""Tests for scenarios."""
+from itertools import product
+
+import pytest
+
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.points.scenarios import RoundScenarios
+from deepwellcup.utils.round_data import RoundData
+from deepwellcup.utils.utils import RoundInfo
+
+
+def test_round_scenarios(ingest):
+    """Test for the win probabilities matching every scenario."""
+    ingest.selections(1)
+    with ingest.database as db:
+        series = db.get_series(RoundInfo(year=2017, played_round=1))
+    is_open = series.index.get_level_values("Series Number") <= 2
+    ingest.series_results(1, *series.loc[~is_open, "Name"])
+    scenarios = RoundScenarios(RoundData(2017, 1, ingest.database))
+    assert len(scenarios.tables) == 4
+    assert scenarios.scenario_count == 8**4
+    wins, standings = _every_scenario(scenarios)
+    summary = scenarios.summary
+    for individual, probability in wins.items():
+        assert summary.at[individual, "Win Probability"] == pytest.approx(probability)
+        assert summary.at[individual, "Eliminated"] == (probability == 0)
+    assert summary.sum()["Win Probability"] == pytest.approx(1)
+    ingest.series_results(1, *series.loc[is_open, "Name"])
+    final = RoundPoints(RoundData(2017, 1, ingest.database)).total.to_dict()
+    assert final in standings
+
+
+def _every_scenario(scenarios):
+    """Return the win probabilities and standings by evaluating each scenario."""
+    outcomes = [
+        [outcome for group in table.outcomes for outcome in group]
+        for table in scenarios.tables
+    ]
+    names = [table.name for table in scenarios.tables]
+    wins = dict.fromkeys(scenarios.current.index, 0.0)
+    every_standings = []
+    for combination in product(*outcomes):
+        standings = scenarios.standings(dict(zip(names, combination))).to_dict()
+        leaders = [
+            individual
+            for individual, points in standings.items()
+            if points == max(standings.values())
+        ]
+        for individual in leaders:
+            wins[individual] += 1 / len(leaders) / scenarios.scenario_count
+        every_standings.append(standings)
+    return wins, every_standings
@@ -0,0 +1,49 @@
+"""Tests for season."""
+import pytest
+
+from deepwellcup.core.database import YearError
+from deepwellcup.core.season import Season, as_season
+from deepwellcup.utils.round_data import SelectionRoundError
+
+
+def _first_round(ingest):
+    """Add the first round of 2017 and return the database."""
+    ingest.selections("Champions", 1)
+    ingest.results(1)
+    return ingest.database
+
+
+def test_season_shares_snapshot(ingest):
+    """Test for playoff rounds reading from one snapshot."""
+    database = _first_round(ingest)
+    season = Season(2017, database)
+    counts = database.statement_counts()
+    rounds = season.rounds()
+    assert season[1] is rounds[1]
+    assert rounds[1].round_data.database is season.data
+    assert rounds["Champions"].round_data.database is season.data
+    assert not rounds[1].points.total.empty
+    assert database.statement_counts() == counts
+
+
+def test_season_errors(ingest):
+    """Test for the errors of a season."""
+    season = Season(2017, _first_round(ingest))
+    with pytest.raises(SelectionRoundError):
+        season["Q"]  # pylint: disable=W0104
+    with pytest.raises(YearError):
+        Season(2018, season.data)
+    with pytest.raises(YearError):
+        as_season(2018, season)
+    assert as_season(2017, season) is season
+
+
+def test_season_reload(ingest):
+    """Test for reading a season again."""
+    season = Season(2017, _first_round(ingest))
+    first = season[2]
+    assert first.round_data.selections.series.empty
+    ingest.selections(2)
+    season.reload()
+    assert season[2] is not first
+    assert not season[2].round_data.selections.series.empty
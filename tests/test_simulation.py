@@ -0,0 +1,43 @@
+"""Tests for simulation."""
+import pytest
+
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.points.simulation import PlayoffSimulation, SeriesOdds
+from deepwellcup.utils.round_data import RoundData
+
+
+def _final_round(ingest):
+    """Add 2017 up to the Stanley Cup final, which is left to play."""
+    ingest.selections(1, "Champions", 3, 4)
+    ingest.results(3)
+
+
+def test_simulation_certain_outcome(ingest):
+    """Test for the ranks when the outcome of the final is certain."""
+    _final_round(ingest)
+    final = ingest.file_results(4).iloc[0]
+    simulation = PlayoffSimulation(RoundData(2017, 4, ingest.database))
+    seeds = simulation.scenarios.open_series.iloc[0]
+    durations = tuple(float(games == final["Duration"]) for games in (4, 5, 6, 7))
+    simulation.odds = {
+        "PIT-NSH": SeriesOdds(float(final["Team"] == seeds["Higher Seed"]), durations)
+    }
+    ranks = simulation.run(samples=100, seed=1)
+    ingest.results(4)
+    champions = RoundPoints(RoundData(2017, "Champions", ingest.database)).selection
+    total = RoundPoints(RoundData(2017, 4, ingest.database)).total.add(
+        champions.fillna(0), fill_value=0
+    )
+    for individual, points in total.items():
+        expected_rank = 1 + int((total > points).sum())
+        assert ranks.loc[individual, expected_rank] == 1
+
+
+def test_simulation_reproducible(ingest):
+    """Test for the same ranks from the same seed with any number of processes."""
+    _final_round(ingest)
+    simulation = PlayoffSimulation(RoundData(2017, 4, ingest.database))
+    ranks = simulation.run(samples=5000, seed=7)
+    assert ranks.equals(simulation.run(samples=5000, seed=7, processes=2))
+    assert ranks.sum(axis="columns").to_numpy() == pytest.approx(1)
+    assert not ranks.equals(simulation.run(samples=5000, seed=8))
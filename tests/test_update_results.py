@@ -0,0 +1,34 @@
+"""Test update results."""
+import pytest
+
+from deepwellcup.points.points import RoundPoints
+from deepwellcup.utils.round_data import RoundData
+from deepwellcup.utils.utils import RoundInfo
+
+
+def test_update_series_result(ingest):
+    """Test for the running totals matching the points of the round."""
+    ingest.selections(1)
+    totals = ingest.series_results(1, *ingest.series(1))
+    expected = RoundPoints(RoundData(2017, 1, ingest.database)).selection
+    assert totals.to_dict() == expected.to_dict()
+    ingest.results(1)
+    with ingest.database as db:
+        totals = db.get_running_totals(RoundInfo(year=2017, played_round=1))
+    assert totals.to_dict() == expected.to_dict()
+
+
+def test_update_series_result_missing(ingest):
+    """Test for a series without a result."""
+    ingest.selections(1)
+    with pytest.raises(ValueError):
+        ingest.series_results(1, "TOR-BOS")
+
+
+def test_update_series_result_without_players(ingest_year):
+    """Test for the running totals in a year without player selections."""
+    ingest = ingest_year(2019)
+    ingest.selections(1)
+    totals = ingest.series_results(1, *ingest.series(1))
+    expected = RoundPoints(RoundData(2019, 1, ingest.database)).selection
+    assert totals.to_dict() == expected.to_dict()
@@ -88,3 +88,22 @@ def test_series_duration_options(
     with expectation:
         a_round = utils.RoundInfo(played_round=played_round, year=year)
         assert a_round.series_duration_options == durations
+
+
+@pytest.mark.parametrize(
+    "year, played_round, number, expectation",
+    [
+        (2006, 1, 8, does_not_raise()),
+        (2006, 3, 2, does_not_raise()),
+        (2006, 4, 1, does_not_raise()),
+        (2006, "Q", 0, pytest.raises(ValueError)),
+        (2020, "Q", 8, does_not_raise()),
+    ],
+)
+def test_number_of_series(
+    year: int, played_round: PlayedRound, number: int, expectation
+):
+    """Test for number_of_series"""
+    with expectation:
+        a_round = utils.RoundInfo(played_round=played_round, year=year)
+        assert a_round.number_of_series == number